@@ -1,10 +1,13 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import altair as alt
 import logging
 from utils.predictor import CorrosionClassifier
 from utils.processors import remove_think_tags
-from utils.vars import environment, uns_nums
-from config.config import SIDEBAR_IMAGE, PAGE_ICON
+from utils.vars import environment, uns_nums, targets
+from utils.warmup import start_warmup
+from config.config import SIDEBAR_IMAGE, PAGE_ICON, SWEEP_MAX_STEPS
 from config.theme import CUSTOM_CSS
 from chat.chat import invoke_llm, get_main_prompt
 
@@ -21,6 +24,7 @@ st.set_page_config(
 )
 st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
+warmup = start_warmup()
 clf = CorrosionClassifier()
 
 # ═══════════════════ Sidebar ═══════════════════
@@ -47,6 +51,29 @@ with st.sidebar:
         "2. The ML model predicts corrosion rate\n"
         "3. An AI generates control recommendations"
     )
+    if warmup.ready:
+        st.caption("🟢 Model ready")
+    elif warmup.done:
+        st.caption("🔴 Model warm-up failed — it will load on first prediction")
+    else:
+        st.caption("⏳ Model warming up…")
+    with st.expander("⚙️ Cache statistics"):
+        st.dataframe(
+            pd.DataFrame(CorrosionClassifier.stage_stats()),
+            use_container_width=True,
+            hide_index=True,
+        )
+        cache_stats = CorrosionClassifier.prediction_cache_stats()
+        st.caption(
+            f"Prediction cache: {cache_stats['size']:,}/{cache_stats['max_entries']:,} "
+            f"entries, hit rate {cache_stats['hit_rate']:.1%}, "
+            f"{cache_stats['evictions']:,} evictions"
+        )
+        inflight = CorrosionClassifier.inflight_stats()
+        st.caption(
+            f"In-flight coalescing: {inflight['coalesced']:,} duplicate requests "
+            f"joined {inflight['executions']:,} computations"
+        )
 
 # ═══════════════════ Hero Header ═══════════════════
 st.markdown('<div class="hero-title">Corrosion Rate Prediction</div>', unsafe_allow_html=True)
@@ -121,8 +148,12 @@ if submitted:
     if not comment.strip():
         st.warning("⚠️ Please describe the condition before predicting.")
     else:
+        if not warmup.done:
+            with st.spinner("⏳ Model is still warming up..."):
+                warmup.wait()
+
         with st.spinner("🔄 Running prediction model..."):
-            prediction, _ = clf.predict(env, temp, conc, uns_input, comment)
+            prediction = clf.predict_label(env, temp, conc, uns_input, comment)
             raw_input = pd.DataFrame(
                 [
                     {
@@ -170,8 +201,8 @@ if "prediction_data" in st.session_state:
     st.markdown(f'<div class="chip-row">{chips}</div>', unsafe_allow_html=True)
 
     # ── Tabbed results ──
-    tab_rec, tab_data, tab_export = st.tabs(
-        ["💡 AI Recommendations", "📋 Input Data", "📦 Export"]
+    tab_rec, tab_data, tab_sweep, tab_export = st.tabs(
+        ["💡 AI Recommendations", "📋 Input Data", "🗺️ What-if Sweep", "📦 Export"]
     )
 
     with tab_rec:
@@ -186,6 +217,84 @@ if "prediction_data" in st.session_state:
         )
         st.dataframe(display_df, use_container_width=True, hide_index=True)
 
+    with tab_sweep:
+        st.caption(
+            "Predicted corrosion rate for this alloy, environment and description "
+            "across a grid of temperatures and concentrations."
+        )
+        base_temp = float(data["Temperature (°C)"][0])
+        sw_col1, sw_col2, sw_col3 = st.columns(3)
+        with sw_col1:
+            temp_range = st.slider(
+                "Temperature range (°C)",
+                min_value=-50.0,
+                max_value=400.0,
+                value=(max(-50.0, base_temp - 50.0), min(400.0, base_temp + 50.0)),
+            )
+        with sw_col2:
+            conc_range = st.slider(
+                "Concentration range (%)", min_value=0.0, max_value=100.0, value=(0.0, 100.0)
+            )
+        with sw_col3:
+            steps = st.slider(
+                "Steps per axis", min_value=2, max_value=SWEEP_MAX_STEPS, value=25
+            )
+
+        sweep_key = (
+            data["Environment"][0],
+            data["Alloy UNS"][0],
+            data["Condition Description"][0],
+            temp_range,
+            conc_range,
+            steps,
+        )
+        if st.button("🗺️  Run Sweep", use_container_width=True):
+            with st.spinner("🔄 Sweeping conditions..."):
+                grid = clf.sweep_conditions(
+                    data["Environment"][0],
+                    data["Alloy UNS"][0],
+                    data["Condition Description"][0],
+                    # Narrow ranges round several steps onto one 0.1 value
+                    np.unique(np.round(np.linspace(*temp_range, steps), 1)),
+                    np.unique(np.round(np.linspace(*conc_range, steps), 1)),
+                )
+            st.session_state.sweep = {"key": sweep_key, "grid": grid}
+
+        sweep = st.session_state.get("sweep")
+        if sweep is not None and sweep["key"] == sweep_key:
+            rate_labels = list(targets.values())
+            heatmap = (
+                alt.Chart(sweep["grid"])
+                .mark_rect()
+                .encode(
+                    x=alt.X(
+                        "Concentration_clean:O",
+                        title="Concentration (%)",
+                        axis=alt.Axis(labelOverlap=True),
+                    ),
+                    y=alt.Y(
+                        "Temperature (deg C):O",
+                        title="Temperature (°C)",
+                        sort="descending",
+                        axis=alt.Axis(labelOverlap=True),
+                    ),
+                    color=alt.Color(
+                        "Predicted Corrosion Rate:N",
+                        scale=alt.Scale(
+                            domain=rate_labels + ["Unknown"],
+                            range=["#2e7d32", "#9ccc65", "#ffb300", "#c62828", "#9e9e9e"],
+                        ),
+                    ),
+                    tooltip=[
+                        "Temperature (deg C)",
+                        "Concentration_clean",
+                        "Predicted Corrosion Rate",
+                        alt.Tooltip("Confidence:Q", format=".2f"),
+                    ],
+                )
+            )
+            st.altair_chart(heatmap, use_container_width=True)
+
     with tab_export:
         exp_col1, exp_col2 = st.columns(2)
 
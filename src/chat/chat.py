@@ -10,6 +10,7 @@ from langchain_groq import ChatGroq
 from langchain_openai import ChatOpenAI
 
 from config.config import GROQ_MODELS, OPENROUTER_MODELS, DEFAULT_LLM_PROVIDER
+from utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -78,8 +79,16 @@ _PROVIDERS = {
 }
 
 
+# Sessions sending the same prompt at the same moment share one LLM call
+_llm_flight = SingleFlight("invoke_llm")
+
+
 def invoke_llm(prompt: str, provider: str | None = None) -> str:
     provider = provider or DEFAULT_LLM_PROVIDER
+    return _llm_flight.do((provider, prompt), _invoke_with_fallback, prompt, provider)
+
+
+def _invoke_with_fallback(prompt: str, provider: str) -> str:
     fallback = "groq" if provider == "openrouter" else "openrouter"
 
     for p in (provider, fallback):
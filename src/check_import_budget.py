@@ -0,0 +1,80 @@
+"""
+Import-time budget check for pages that must start without the ML stack.
+
+Runs a page's top-level imports in a fresh interpreter, subtracts bare
+interpreter startup, and fails if the import time exceeds the budget or if any
+heavy module (torch, transformers, joblib, sklearn) was loaded.
+
+Usage: python check_import_budget.py [--page PATH] [--budget SECONDS]
+"""
+
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+_DEFAULT_PAGE = os.path.join(current_dir, "pages", "Material_Selection_Page.py")
+_DEFAULT_BUDGET_SECONDS = 4.0
+_FORBIDDEN_MODULES = ("torch", "transformers", "joblib", "sklearn")
+
+
+def page_imports(page_path: str) -> list[str]:
+    """Return the page's top-level import statements as source lines."""
+    with open(page_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=page_path)
+    return [
+        ast.unparse(node)
+        for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    ]
+
+
+def timed_run(code: str) -> tuple[float, str]:
+    """Run code in a fresh interpreter from src/, returning (seconds, stdout)."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=current_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return time.perf_counter() - start, result.stdout
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--page", default=_DEFAULT_PAGE)
+    parser.add_argument("--budget", type=float, default=_DEFAULT_BUDGET_SECONDS)
+    args = parser.parse_args()
+
+    probe = "\n".join(
+        page_imports(args.page)
+        + [
+            "import json, sys",
+            f"print(json.dumps([m for m in {_FORBIDDEN_MODULES!r} if m in sys.modules]))",
+        ]
+    )
+    baseline, _ = timed_run("pass")
+    elapsed, stdout = timed_run(probe)
+    import_seconds = elapsed - baseline
+    loaded = json.loads(stdout.strip().splitlines()[-1])
+
+    print(f"---- Import Budget: {os.path.basename(args.page)} ----")
+    print(f"  - cold import: {import_seconds:.2f}s (budget {args.budget:.2f}s)")
+    print(f"  - heavy modules loaded: {', '.join(loaded) or 'none'}")
+
+    if loaded or import_seconds > args.budget:
+        print("❌ Import budget exceeded")
+        return 1
+    print("✅ Within import budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
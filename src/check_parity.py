@@ -0,0 +1,193 @@
+"""
+Check that the compiled (array-backed) transforms reproduce the original
+fitted models. Exits non-zero on any mismatch.
+
+The forest is checked on a golden set whose feature values sit exactly on, and
+one float32 step either side of, every split threshold, with a share of rows
+carrying missing (NaN) features, plus any real feature rows supplied with
+--golden (an .npy matrix in model column order). The compacted forest, a
+forest pruned on half of that set, and the forest read back from an inference
+bundle are all compared against scikit-learn.
+
+Usage: python check_parity.py [--golden features.npy]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+
+# Add src to python path to mimic app behavior
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+from config.config import MODEL_PATHS
+from utils.bundle import open_bundle, write_bundle
+from utils.compiled import (
+    CompiledForest,
+    LookupEncoder,
+    PCAProjector,
+    ScalerTransform,
+    compile_pipeline,
+    max_encoder_deviation,
+)
+from utils.vars import environment, uns_nums
+
+_ENCODER_TOLERANCE = 1e-12
+_PCA_TOLERANCE = 1e-4
+_N_SAMPLE_EMBEDDINGS = 256
+_N_GOLDEN_ROWS = 5000
+# Share of golden rows with missing features, and of features missing in them
+_NAN_ROW_FRACTION = 0.2
+_NAN_FEATURE_FRACTION = 0.3
+
+
+def check_encoders(models: dict) -> list[str]:
+    failures = []
+    for name, column, domain in (
+        ("env_encoder", "Environment", environment),
+        ("uns_encoder", "UNS", uns_nums),
+    ):
+        lookup = LookupEncoder.from_encoder(models[name], column, domain)
+        probe = list(domain) + ["__not_a_category__"]
+        deviation = max_encoder_deviation(models[name], lookup, probe)
+        print(f"  - {name}: max |Δ| = {deviation:.3g} over {len(probe)} values")
+        if deviation > _ENCODER_TOLERANCE:
+            failures.append(name)
+    return failures
+
+
+def check_scaler(models: dict) -> list[str]:
+    scaler = models["temp_scaler"]
+    temps = np.linspace(-50.0, 400.0, 91)
+    expected = scaler.transform(pd.DataFrame({"Temperature (deg C)": temps})).ravel()
+    deviation = float(np.max(np.abs(expected - ScalerTransform.from_scaler(scaler)(temps))))
+    print(f"  - temp_scaler: max |Δ| = {deviation:.3g}")
+    return ["temp_scaler"] if deviation > _ENCODER_TOLERANCE else []
+
+
+def check_pca(models: dict) -> list[str]:
+    pca = models["pca"]
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(scale=0.5, size=(_N_SAMPLE_EMBEDDINGS, pca.n_features_in_))
+    scibert_df = pd.DataFrame(
+        embeddings, columns=[f"scibert_{i}" for i in range(embeddings.shape[1])]
+    )
+    expected = pca.transform(scibert_df)
+    deviation = float(np.max(np.abs(expected - PCAProjector.from_pca(pca)(embeddings))))
+    print(f"  - pca: max |Δ| = {deviation:.3g}")
+    return ["pca"] if deviation > _PCA_TOLERANCE else []
+
+
+def forest_golden_set(forest, n_rows: int, rng) -> np.ndarray:
+    """Rows built from split thresholds and their float32 neighbours.
+
+    When the forest routes missing values (scikit-learn >= 1.3), a share of
+    rows also has random features set to NaN.
+    """
+    splits: dict[int, list[np.ndarray]] = {}
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        internal = tree.children_left != -1
+        for feature in np.unique(tree.feature[internal]):
+            mask = internal & (tree.feature == feature)
+            splits.setdefault(int(feature), []).append(tree.threshold[mask])
+
+    golden = rng.normal(size=(n_rows, forest.n_features_in_)).astype(np.float32)
+    for feature, thresholds in splits.items():
+        base = np.unique(np.concatenate(thresholds)).astype(np.float32)
+        candidates = np.concatenate(
+            [
+                base,
+                np.nextafter(base, np.float32(np.inf)),
+                np.nextafter(base, np.float32(-np.inf)),
+            ]
+        )
+        golden[:, feature] = rng.choice(candidates, size=n_rows)
+
+    if hasattr(forest.estimators_[0].tree_, "missing_go_to_left"):
+        nan_rows = rng.random(n_rows) < _NAN_ROW_FRACTION
+        nan_cells = rng.random(golden.shape) < _NAN_FEATURE_FRACTION
+        golden[nan_rows[:, np.newaxis] & nan_cells] = np.nan
+    return golden
+
+
+def _forest_mismatches(
+    label: str, compiled: CompiledForest, golden: np.ndarray, expected: np.ndarray
+) -> int:
+    wrong = compiled.predict(golden) != expected
+    nan_rows = np.isnan(golden).any(axis=1)
+    print(
+        f"  - {label}: {int(wrong.sum())} class mismatches over {len(golden)} "
+        f"golden rows ({int(wrong[nan_rows].sum())} of {int(nan_rows.sum())} "
+        "rows with NaN)"
+    )
+    return int(wrong.sum())
+
+
+def check_forest(models: dict, golden_path: str | None) -> list[str]:
+    forest = models["model"]
+    golden = forest_golden_set(forest, _N_GOLDEN_ROWS, np.random.default_rng(0))
+    if golden_path:
+        golden = np.vstack([golden, np.load(golden_path).astype(np.float32)])
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="X does not have valid feature names")
+        expected = forest.predict(golden)
+        expected_proba = forest.predict_proba(golden)
+    compiled = CompiledForest.from_sklearn(forest).compact()
+    failed = bool(_forest_mismatches("model", compiled, golden, expected))
+    deviation = float(np.max(np.abs(compiled.predict_proba(golden) - expected_proba)))
+    print(f"  - model: proba max |Δ| = {deviation:.3g}")
+
+    early, trees_used = compiled.predict_early_exit(golden)
+    early_mismatches = int(np.sum(early != expected))
+    print(
+        f"  - model (early exit): {early_mismatches} class mismatches, "
+        f"mean {trees_used.mean():.1f}/{compiled.n_trees} trees per row"
+    )
+    failed |= bool(early_mismatches)
+
+    # Pruning only promises identical predictions on its own holdout rows
+    holdout = golden[::2]
+    pruned = compiled.prune(holdout)
+    failed |= bool(
+        _forest_mismatches(
+            f"model (pruned to {pruned.n_trees}/{compiled.n_trees} trees, holdout)",
+            pruned,
+            holdout,
+            expected[::2],
+        )
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bundle.bin")
+        write_bundle(compile_pipeline(models), path)
+        bundled = open_bundle(path)[0]["model"]
+        failed |= bool(_forest_mismatches("model (bundle)", bundled, golden, expected))
+    return ["model"] if failed else []
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--golden", help="extra .npy feature rows for the forest")
+    args = parser.parse_args()
+
+    models = {name: joblib.load(path) for name, path in MODEL_PATHS.items()}
+    print("---- Compiled Transform Parity ----")
+    failures = check_encoders(models) + check_scaler(models) + check_pca(models)
+    failures += check_forest(models, args.golden)
+    if failures:
+        print(f"❌ Parity check failed for: {', '.join(failures)}")
+        return 1
+    print("✅ All compiled transforms match the original models")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
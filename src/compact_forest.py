@@ -0,0 +1,116 @@
+"""
+Compact the random forest pickle into a small array representation.
+
+Flattens rf_all_data.pkl into float32 thresholds, smallest-int node and feature
+indices and a deduplicated leaf table, and writes it to FOREST_COMPACT_PATH.
+With --holdout, trees that do not change any holdout prediction are dropped;
+if --labels are given too, accuracy before and after pruning is reported and
+the result is only written when it is unchanged. Load time and RSS growth of
+the sklearn pickle and of the compact file are each measured in a fresh
+interpreter. Run export_bundle.py --compact-forest afterwards to ship the
+result.
+
+Usage: python compact_forest.py [--holdout X.npy [--labels y.npy]] [--output PATH]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+import joblib
+import numpy as np
+
+# Add src to python path to mimic app behavior
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+from config.config import FOREST_COMPACT_PATH, MODEL_PATHS
+from utils.artifacts import artifact_digest, estimate_nbytes
+from utils.forest import CompiledForest, save_forest
+
+# Runs in a fresh interpreter so each measurement starts from the same baseline
+_MEASURE_SCRIPT = """
+import sys, time
+sys.path.insert(0, {src!r})
+import joblib, numpy
+from utils.artifacts import current_rss_bytes
+from utils.forest import load_forest
+rss = current_rss_bytes()
+start = time.perf_counter()
+obj = {loader}({path!r})
+print(time.perf_counter() - start, (current_rss_bytes() or 0) - (rss or 0))
+"""
+
+
+def measure_load(loader: str, path: str) -> tuple[float, int]:
+    """Return (seconds, RSS growth in bytes) of loading ``path`` in a new process."""
+    script = _MEASURE_SCRIPT.format(src=current_dir, loader=loader, path=path)
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    seconds, rss = result.stdout.split()
+    return float(seconds), int(rss)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--holdout", help=".npy feature rows in model column order")
+    parser.add_argument("--labels", help=".npy true labels for the holdout rows")
+    parser.add_argument("--output", default=FOREST_COMPACT_PATH)
+    args = parser.parse_args()
+    if args.labels and not args.holdout:
+        parser.error("--labels requires --holdout")
+
+    source = MODEL_PATHS["model"]
+    sklearn_forest = joblib.load(source)
+    flat = CompiledForest.from_sklearn(sklearn_forest)
+    compact = flat.compact()
+
+    print("---- Forest Compaction ----")
+    print(f"  - sklearn arrays:  {estimate_nbytes(sklearn_forest) / 1e6:8.1f} MB")
+    print(f"  - flattened:       {flat.nbytes / 1e6:8.1f} MB")
+    print(
+        f"  - compacted:       {compact.nbytes / 1e6:8.1f} MB "
+        f"({compact.n_nodes} nodes, {len(compact.value)} unique leaves, "
+        f"index {compact.left.dtype})"
+    )
+
+    if args.holdout:
+        holdout = np.load(args.holdout).astype(np.float32)
+        pruned = compact.prune(holdout)
+        print(
+            f"  - pruned:          {pruned.nbytes / 1e6:8.1f} MB "
+            f"({pruned.n_trees}/{compact.n_trees} trees kept)"
+        )
+        if np.any(pruned.predict(holdout) != compact.predict(holdout)):
+            print("❌ Pruned forest changed holdout predictions; not written")
+            return 1
+        if args.labels:
+            labels = np.load(args.labels, allow_pickle=True).astype(str)
+            before = np.mean(compact.predict(holdout).astype(str) == labels)
+            after = np.mean(pruned.predict(holdout).astype(str) == labels)
+            print(f"  - holdout accuracy: {before:.4f} → {after:.4f}")
+            if after != before:
+                print("❌ Pruning changed holdout accuracy; not written")
+                return 1
+        compact = pruned
+
+    save_forest(compact, args.output, artifact_digest(source))
+
+    print("---- Load Cost (fresh process) ----")
+    for label, loader, path in (
+        ("sklearn pickle", "joblib.load", source),
+        ("compact forest", "load_forest", args.output),
+    ):
+        seconds, rss = measure_load(loader, path)
+        print(
+            f"  - {label}: {os.path.getsize(path) / 1e6:.1f} MB on disk, "
+            f"load {seconds:.3f}s, RSS +{rss / 1e6:.1f} MB"
+        )
+    print(f"✅ Wrote {args.output}; run export_bundle.py --compact-forest to ship it")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
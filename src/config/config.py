@@ -26,6 +26,83 @@ MODEL_PATHS: dict[str, str] = {
     ),
 }
 
+# Integrity manifest for the artifacts above (see verify_artifacts.py)
+ARTIFACT_MANIFEST_PATH: str = os.path.join(BASE_PATH, "models", "manifest.json")
+
+# Flat memory-mapped bundle of the compiled pipeline (see export_bundle.py).
+# Used instead of the pickles above when present and not stale.
+INFERENCE_BUNDLE_PATH: str = os.path.join(BASE_PATH, "models", "inference_bundle.bin")
+
+# Compacted (and optionally pruned) forest written by compact_forest.py; used by
+# export_bundle.py --compact-forest in place of the forest pickle
+FOREST_COMPACT_PATH: str = os.path.join(
+    BASE_PATH, "models", "classifiers", "rf_compact.npz"
+)
+
+# Stop forest voting early for interactive single predictions once the leading
+# class cannot be overtaken. Batch scoring always evaluates the full forest.
+FOREST_EARLY_EXIT: bool = True
+
+# Rows per task for multi-process batch scoring (see utils/parallel.py)
+PARALLEL_CHUNK_ROWS: int = 8192
+
+# Staged pipeline executor (see utils/pipeline.py): rows per chunk and the
+# number of chunks each inter-stage queue may hold
+PIPELINE_CHUNK_ROWS: int = 1024
+PIPELINE_QUEUE_SIZE: int = 4
+
+# Rows per chunk read, scored and checkpointed by utils/batch_score.py
+BATCH_SCORE_CHUNK_ROWS: int = 10_000
+
+# Bulk upload page: rows scored per chunk and rows kept for on-page previews
+BULK_CHUNK_ROWS: int = 2_000
+BULK_PREVIEW_ROWS: int = 1_000
+
+# Largest number of steps per axis in the what-if temperature/concentration sweep
+SWEEP_MAX_STEPS: int = 50
+
+# ---- SciBERT Inference Backend ----
+# Options: "torch" (fp32 reference), "torch-int8" (dynamic int8), "onnx" (ONNX Runtime)
+SCIBERT_BACKEND: str = os.environ.get("SCIBERT_BACKEND", "torch")
+SCIBERT_ONNX_PATH: str = os.path.join(BASE_PATH, "models", "scibert", "scibert.onnx")
+
+# ---- SciBERT Offline Bundle ----
+# Local directory holding the tokenizer and weights (see materialize_scibert.py).
+# Startup never touches the network: a missing bundle is an error unless
+# SCIBERT_OFFLINE=0 explicitly allows falling back to the Hugging Face hub.
+SCIBERT_MODEL_NAME: str = "allenai/scibert_scivocab_uncased"
+SCIBERT_MODEL_DIR: str = os.path.join(
+    BASE_PATH, "models", "scibert", "scibert_scivocab_uncased"
+)
+SCIBERT_OFFLINE: bool = os.environ.get("SCIBERT_OFFLINE", "1") != "0"
+
+# ---- Embedding Cache ----
+# Disk-backed SciBERT embedding store; survives restarts and can be shared by
+# replicas mounting the same directory.
+EMBEDDING_CACHE_DIR: str = os.path.join(BASE_PATH, "cache", "embeddings")
+EMBEDDING_CACHE_MAX_ENTRIES: int = 50_000
+
+# Reduced PCA vectors per cleaned description, partitioned by pca.pkl version
+PCA_CACHE_DIR: str = os.path.join(BASE_PATH, "cache", "pca")
+PCA_CACHE_MAX_ENTRIES: int = 500_000
+
+# In-process memo per feature stage (description → PCA, environment, UNS,
+# temperature); entries per stage before least-recently-used eviction
+STAGE_MEMO_MAX_ENTRIES: int = 10_000
+
+# ---- Prediction Cache ----
+# Final results for identical inputs. Models are loaded once per process, so new
+# artifacts take effect on restart (or a resource-cache clear), which also
+# empties this cache.
+# Statistics are written in Prometheus text format for node_exporter's textfile
+# collector.
+PREDICTION_CACHE_MAX_ENTRIES: int = 10_000
+PREDICTION_CACHE_TTL_SECONDS: float = 24 * 3600.0
+PREDICTION_CACHE_METRICS_PATH: str = os.path.join(
+    BASE_PATH, "cache", "metrics", "prediction_cache.prom"
+)
+PREDICTION_CACHE_METRICS_INTERVAL: float = 15.0
+
 # ---- Feature Column Definitions ----
 NOT_COMPOSE_COLUMNS: list[str] = [
     "Environment",
@@ -35,6 +112,10 @@ NOT_COMPOSE_COLUMNS: list[str] = [
 ]
 CATEGORICAL_COLUMNS: list[str] = ["Environment"]
 
+# Free-text condition description column expected by batch scoring
+COMMENT_COLUMN: str = "comment"
+BATCH_INPUT_COLUMNS: list[str] = NOT_COMPOSE_COLUMNS + [COMMENT_COLUMN]
+
 # ---- Asset Paths ----
 PAGE_ICON: str = os.path.join(BASE_PATH, "assets", "images", "corrosive.png")
 PIPE_ICON: str = os.path.join(BASE_PATH, "assets", "images", "pipe.png")
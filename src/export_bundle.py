@@ -0,0 +1,88 @@
+"""
+Export the fitted pipeline into a single memory-mappable inference bundle.
+
+Loads the pickled artifacts, compiles encoders, scaler, PCA and forest into flat
+NumPy arrays and writes them to INFERENCE_BUNDLE_PATH. The app then maps that
+file instead of unpickling. Re-run after replacing any artifact; a bundle built
+from artifacts that no longer match the manifest is ignored at startup. With
+--compact-forest, the (possibly pruned) forest written by compact_forest.py is
+bundled instead of the full forest compiled from the pickle; it must have been
+built from the current forest pickle.
+
+Usage: python export_bundle.py [--output PATH] [--compact-forest]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+# Add src to python path to mimic app behavior
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+from config.config import (
+    ARTIFACT_MANIFEST_PATH,
+    FOREST_COMPACT_PATH,
+    INFERENCE_BUNDLE_PATH,
+    MODEL_PATHS,
+)
+from utils.artifacts import artifact_digest, load_artifacts, read_manifest
+from utils.bundle import open_bundle, write_bundle
+from utils.compiled import compile_pipeline
+from utils.forest import load_forest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", default=INFERENCE_BUNDLE_PATH)
+    parser.add_argument(
+        "--compact-forest",
+        action="store_true",
+        help=f"bundle the forest from {FOREST_COMPACT_PATH} instead of the pickle",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(message)s")
+
+    start = time.perf_counter()
+    models, _ = load_artifacts(MODEL_PATHS, read_manifest(ARTIFACT_MANIFEST_PATH))
+    unpickle_seconds = time.perf_counter() - start
+
+    compiled = compile_pipeline(models)
+    sources = {name: artifact_digest(path) for name, path in MODEL_PATHS.items()}
+    forest_source = MODEL_PATHS["model"]
+    if args.compact_forest:
+        if not os.path.exists(FOREST_COMPACT_PATH):
+            print(f"❌ No compacted forest at {FOREST_COMPACT_PATH}")
+            return 1
+        forest, source_sha256 = load_forest(FOREST_COMPACT_PATH)
+        if source_sha256 != sources["model"]:
+            print(
+                f"❌ Compacted forest {FOREST_COMPACT_PATH} is stale; "
+                "rerun compact_forest.py"
+            )
+            return 1
+        compiled["model"] = forest
+        forest_source = FOREST_COMPACT_PATH
+    metadata = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "sources": sources,
+        "n_trees": compiled["model"].n_trees,
+    }
+    write_bundle(compiled, args.output, metadata)
+
+    start = time.perf_counter()
+    open_bundle(args.output)
+    mmap_seconds = time.perf_counter() - start
+
+    print(f"✅ Wrote {args.output} ({os.path.getsize(args.output) / 1e6:.1f} MB)")
+    print(f"  - forest: {forest_source} ({compiled['model'].n_trees} trees)")
+    print(f"  - unpickle all artifacts: {unpickle_seconds:.3f}s")
+    print(f"  - open bundle (mmap):     {mmap_seconds:.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
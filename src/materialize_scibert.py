@@ -0,0 +1,64 @@
+"""
+Materialize the offline SciBERT bundle used by air-gapped deployments.
+
+Downloads the tokenizer and weights once (on a connected machine) and saves
+them to SCIBERT_MODEL_DIR; with --onnx the ONNX graph is exported from the
+bundle as well; the app never exports it at startup. Copy the resulting
+directory to the target nodes; the app then loads SciBERT from disk without
+touching the network.
+
+Usage: python materialize_scibert.py [--onnx] [--force]
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Add src to python path to mimic app behavior
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+from transformers import AutoModel, AutoTokenizer
+
+from config.config import SCIBERT_MODEL_DIR, SCIBERT_MODEL_NAME, SCIBERT_ONNX_PATH
+from utils.scibert_backends import export_onnx
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--onnx",
+        action="store_true",
+        help="also export the ONNX graph (required for SCIBERT_BACKEND=onnx)",
+    )
+    parser.add_argument("--force", action="store_true", help="overwrite the bundle")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(message)s")
+
+    if os.path.isfile(os.path.join(SCIBERT_MODEL_DIR, "config.json")) and not args.force:
+        logger.info("Bundle already present at %s (use --force)", SCIBERT_MODEL_DIR)
+    else:
+        logger.info("Downloading %s", SCIBERT_MODEL_NAME)
+        os.makedirs(SCIBERT_MODEL_DIR, exist_ok=True)
+        AutoTokenizer.from_pretrained(SCIBERT_MODEL_NAME).save_pretrained(
+            SCIBERT_MODEL_DIR
+        )
+        AutoModel.from_pretrained(SCIBERT_MODEL_NAME).save_pretrained(
+            SCIBERT_MODEL_DIR
+        )
+        logger.info("Saved SciBERT bundle to %s", SCIBERT_MODEL_DIR)
+
+    if args.onnx and (args.force or not os.path.exists(SCIBERT_ONNX_PATH)):
+        export_onnx(SCIBERT_MODEL_DIR, SCIBERT_ONNX_PATH)
+
+    for name in sorted(os.listdir(SCIBERT_MODEL_DIR)):
+        size = os.path.getsize(os.path.join(SCIBERT_MODEL_DIR, name))
+        print(f"  - {name}: {size / 1e6:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+import hashlib
+import io
+from collections import Counter
+
+import pandas as pd
+import streamlit as st
+
+from config.config import (
+    BATCH_INPUT_COLUMNS,
+    BULK_CHUNK_ROWS,
+    BULK_PREVIEW_ROWS,
+    PAGE_ICON,
+    SIDEBAR_IMAGE,
+)
+from config.theme import CUSTOM_CSS
+from utils.bulk import (
+    ERROR_COLUMN,
+    PREDICTION_COLUMN,
+    missing_columns,
+    normalize_columns,
+    validate_rows,
+)
+from utils.predictor import CorrosionClassifier
+from utils.warmup import start_warmup
+
+st.set_page_config(
+    page_title="Bulk Scoring",
+    layout="wide",
+    page_icon=PAGE_ICON,
+    initial_sidebar_state="expanded",
+)
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+warmup = start_warmup()
+clf = CorrosionClassifier()
+
+# ═══════════════════ Sidebar ═══════════════════
+with st.sidebar:
+    st.image(SIDEBAR_IMAGE, use_container_width=True)
+    st.markdown("## 📑 Bulk Scoring")
+    st.caption(
+        "Score a whole inspection list at once by uploading a CSV of "
+        "material and environment conditions."
+    )
+    st.markdown("---")
+    st.markdown(
+        "**Expected columns:**\n"
+        "- Environment\n"
+        "- UNS\n"
+        "- Temperature (°C)\n"
+        "- Concentration (%)\n"
+        "- Description"
+    )
+
+
+def score_upload(data: bytes, total_rows: int) -> dict:
+    """Validate and score an uploaded CSV chunk by chunk.
+
+    Only one chunk of rows and its features are held at a time; scored rows are
+    appended straight to the CSV download buffer.
+    """
+    output = io.BytesIO()
+    progress = st.progress(0.0, text="Scoring…")
+    counts: Counter = Counter()
+    preview, invalid_rows = [], []
+    n_rows = n_invalid = n_previewed = n_invalid_kept = 0
+
+    chunks = pd.read_csv(io.BytesIO(data), chunksize=BULK_CHUNK_ROWS)
+    for i, chunk in enumerate(chunks):
+        chunk = normalize_columns(chunk)
+        errors = validate_rows(chunk)
+        valid = errors == ""
+
+        labels = pd.Series("", index=chunk.index, dtype=object)
+        if valid.any():
+            scored, _ = clf.predict_batch(chunk.loc[valid, BATCH_INPUT_COLUMNS])
+            labels[valid] = scored
+        chunk[PREDICTION_COLUMN] = labels
+        chunk[ERROR_COLUMN] = errors
+        chunk.to_csv(output, header=i == 0, index=False, encoding="utf-8")
+
+        counts.update(labels[valid])
+        n_rows += len(chunk)
+        n_invalid += int((~valid).sum())
+        if n_previewed < BULK_PREVIEW_ROWS:
+            preview.append(chunk.head(BULK_PREVIEW_ROWS - n_previewed))
+            n_previewed += len(preview[-1])
+        if n_invalid_kept < BULK_PREVIEW_ROWS and not valid.all():
+            invalid_rows.append(chunk[~valid].head(BULK_PREVIEW_ROWS - n_invalid_kept))
+            n_invalid_kept += len(invalid_rows[-1])
+        progress.progress(
+            min(n_rows / total_rows, 1.0), text=f"Scored {n_rows:,} rows…"
+        )
+    progress.empty()
+
+    return {
+        "csv": output.getvalue(),
+        "rows": n_rows,
+        "invalid": n_invalid,
+        "counts": dict(counts),
+        "preview": pd.concat(preview) if preview else pd.DataFrame(),
+        "invalid_rows": pd.concat(invalid_rows) if invalid_rows else pd.DataFrame(),
+    }
+
+
+# ═══════════════════ Hero Header ═══════════════════
+st.markdown('<div class="hero-title">Bulk Corrosion Scoring</div>', unsafe_allow_html=True)
+st.markdown(
+    '<div class="hero-subtitle">'
+    "Upload a CSV of conditions to predict corrosion rates for every row "
+    "and download the results."
+    "</div>",
+    unsafe_allow_html=True,
+)
+
+# ═══════════════════ Upload ═══════════════════
+uploaded = st.file_uploader("Upload a CSV file", type=["csv"])
+
+if uploaded is not None:
+    data = uploaded.getvalue()
+    file_key = hashlib.sha256(data).hexdigest()
+    header = normalize_columns(pd.read_csv(io.BytesIO(data), nrows=0))
+    missing = missing_columns(header)
+    result = st.session_state.get("bulk_result")
+
+    if missing:
+        st.error(f"⚠️ The file is missing required columns: {', '.join(missing)}")
+    elif result is None or result["key"] != file_key:
+        total_rows = max(1, data.count(b"\n") - 1)  # estimate for the progress bar
+        st.caption(f"📄 {uploaded.name}: about {total_rows:,} rows")
+        if st.button("⚡  Score File", use_container_width=True):
+            if not warmup.done:
+                with st.spinner("⏳ Model is still warming up..."):
+                    warmup.wait()
+            # Kept in session state so reruns reuse the result instead of rescoring
+            st.session_state.bulk_result = {
+                "key": file_key,
+                "name": uploaded.name,
+                **score_upload(data, total_rows),
+            }
+            st.rerun()
+
+# ═══════════════════ Results Display ═══════════════════
+result = st.session_state.get("bulk_result")
+if uploaded is not None and result is not None and result["key"] == file_key:
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Rows", f"{result['rows']:,}")
+    m2.metric("Scored", f"{result['rows'] - result['invalid']:,}")
+    m3.metric("Invalid", f"{result['invalid']:,}")
+
+    tab_summary, tab_preview, tab_invalid = st.tabs(
+        ["📊 Rate Distribution", "📋 Preview", "⚠️ Invalid Rows"]
+    )
+
+    with tab_summary:
+        if result["counts"]:
+            st.bar_chart(pd.Series(result["counts"], name="Rows").sort_index())
+        else:
+            st.info("No valid rows were scored.")
+
+    with tab_preview:
+        st.caption(f"First {len(result['preview']):,} rows")
+        st.dataframe(result["preview"], use_container_width=True, hide_index=True)
+
+    with tab_invalid:
+        if result["invalid"]:
+            st.caption(
+                f"Showing {len(result['invalid_rows']):,} of "
+                f"{result['invalid']:,} invalid rows"
+            )
+            st.dataframe(
+                result["invalid_rows"], use_container_width=True, hide_index=True
+            )
+        else:
+            st.success("✅ Every row passed validation.")
+
+    base_name = result["name"].rsplit(".", 1)[0]
+    st.download_button(
+        label="📊  Download Scored CSV",
+        data=result["csv"],
+        file_name=f"{base_name}_scored.csv",
+        mime="text/csv",
+        use_container_width=True,
+        key="download_bulk_csv",
+    )
+
+# ═══════════════════ Footer ═══════════════════
+st.markdown(
+    '<div class="footer">'
+    "Built with Streamlit · Machine Learning · SciBERT + PCA · Batch Scoring"
+    "</div>",
+    unsafe_allow_html=True,
+)
@@ -1,10 +1,17 @@
+import logging
 import streamlit as st
 from chat.chat import invoke_llm
+from utils.predictor import CorrosionClassifier
 from utils.vars import environment
 from config.config import PIPE_ICON, MATERIAL_SELECTION_IMAGE, SIDEBAR_IMAGE
 from config.theme import CUSTOM_CSS
 from utils.processors import remove_think_tags
 
+logger = logging.getLogger(__name__)
+
+# Alloys shown in the ML shortlist
+SHORTLIST_SIZE = 10
+
 st.set_page_config(
     page_title="Material Selector",
     layout="wide",
@@ -13,6 +20,8 @@ st.set_page_config(
 )
 st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
+clf = CorrosionClassifier()
+
 # ═══════════════════ Sidebar ═══════════════════
 with st.sidebar:
     st.image(MATERIAL_SELECTION_IMAGE, use_container_width=True)
@@ -33,7 +42,7 @@ with st.sidebar:
         "**How it works:**\n"
         "1. Describe the operating environment\n"
         "2. Set design constraints\n"
-        "3. Get top material recommendations"
+        "3. Get an instant ML shortlist and top material recommendations"
     )
 
 # ═══════════════════ Hero Header ═══════════════════
@@ -68,6 +77,9 @@ with st.form("llm_material_selector"):
 
     with c2:
         temperature = st.number_input("Operating Temperature (°C)", value=25)
+        concentration = st.number_input(
+            "Concentration (%)", min_value=0, max_value=100, value=50
+        )
         pressure = st.number_input("Operating Pressure (bar)", value=1.0)
 
     with c3:
@@ -115,8 +127,21 @@ with st.form("llm_material_selector"):
         "⚡  Suggest Materials", use_container_width=True
     )
 
-# ═══════════════════ LLM Processing ═══════════════════
+# ═══════════════════ ML Shortlist + LLM Processing ═══════════════════
 if submitted:
+    condition = (
+        f"{env} environment, pH {pH}, {chloride.lower()} chloride, "
+        f"{flow.lower()} flow, {pressure} bar. {custom_notes}"
+    )
+    with st.spinner("🧪 Ranking alloys with the ML model..."):
+        try:
+            st.session_state.material_ranking = clf.rank_alloys(
+                env, temperature, concentration, condition
+            )
+        except Exception as e:
+            logger.error("Alloy ranking failed: %s", e)
+            st.session_state.material_ranking = None
+
     user_prompt = f"""
 You are a corrosion engineering assistant helping select optimal materials for corrosion resistance in industrial settings.
 
@@ -126,6 +151,7 @@ Based on the following operating and environmental conditions, recommend the **t
 - pH Level: {pH}
 - Chloride Presence: {chloride}
 - Temperature: {temperature}°C
+- Concentration: {concentration}%
 - Pressure: {pressure} bar
 - Flow Condition: {flow}
 - Galvanic Contact: {contact}
@@ -157,6 +183,7 @@ Use a **professional and concise tone**. Structure your response clearly with bu
         "pH Level": pH,
         "Chloride": chloride,
         "Temperature": f"{temperature}°C",
+        "Concentration": f"{concentration}%",
         "Pressure": f"{pressure} bar",
         "Flow": flow,
         "Galvanic Contact": contact,
@@ -183,10 +210,43 @@ if "material_response" in st.session_state:
     tab_rec, tab_export = st.tabs(["🔬 Material Recommendations", "📦 Export"])
 
     with tab_rec:
-        st.markdown(
-            f'<div class="rec-box">{st.session_state.material_response}</div>',
-            unsafe_allow_html=True,
-        )
+        ranking = st.session_state.get("material_ranking")
+        col_ml, col_llm = st.columns([2, 3])
+
+        with col_ml:
+            st.markdown(
+                '<div class="card-header">🧪 ML Shortlist</div>',
+                unsafe_allow_html=True,
+            )
+            if ranking is None:
+                st.warning("⚠️ The ML ranking is unavailable for this request.")
+            else:
+                st.caption(
+                    f"Top {SHORTLIST_SIZE} of {len(ranking)} alloys by predicted "
+                    "corrosion rate"
+                )
+                st.dataframe(
+                    ranking.head(SHORTLIST_SIZE).drop(columns=["Expected Rate Index"]),
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={
+                        column: st.column_config.ProgressColumn(
+                            column, min_value=0.0, max_value=1.0, format="%.2f"
+                        )
+                        for column in ranking.columns
+                        if column.startswith("P(")
+                    },
+                )
+
+        with col_llm:
+            st.markdown(
+                '<div class="card-header">💡 LLM Recommendations</div>',
+                unsafe_allow_html=True,
+            )
+            st.markdown(
+                f'<div class="rec-box">{st.session_state.material_response}</div>',
+                unsafe_allow_html=True,
+            )
 
     with tab_export:
         txt_content = "Material Selection Report\n" + "=" * 40 + "\n\n"
@@ -196,14 +256,28 @@ if "material_response" in st.session_state:
         txt_content += "\nAI Recommendations:\n" + "-" * 40 + "\n"
         txt_content += st.session_state.material_response
 
-        st.download_button(
-            label="📝  Download Report as TXT",
-            data=txt_content.encode("utf-8"),
-            file_name="material_recommendations.txt",
-            mime="text/plain",
-            use_container_width=True,
-            key="download_material_txt",
-        )
+        exp_col1, exp_col2 = st.columns(2)
+
+        with exp_col1:
+            st.download_button(
+                label="📝  Download Report as TXT",
+                data=txt_content.encode("utf-8"),
+                file_name="material_recommendations.txt",
+                mime="text/plain",
+                use_container_width=True,
+                key="download_material_txt",
+            )
+
+        with exp_col2:
+            if ranking is not None:
+                st.download_button(
+                    label="📊  Download Alloy Ranking as CSV",
+                    data=ranking.to_csv(index=False).encode("utf-8"),
+                    file_name="alloy_ranking.csv",
+                    mime="text/csv",
+                    use_container_width=True,
+                    key="download_ranking_csv",
+                )
 
 # ═══════════════════ Footer ═══════════════════
 st.markdown(
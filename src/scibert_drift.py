@@ -0,0 +1,102 @@
+"""
+Report how far a SciBERT inference backend drifts from the fp32 reference.
+
+Embeds a reference set with the ``torch`` backend and with the candidate
+backend, then prints embedding drift (cosine similarity, max abs difference),
+PCA-space drift and any predicted class that changes.
+
+Usage:
+    python scibert_drift.py --backend torch-int8
+    python scibert_drift.py --backend onnx --reference reference.csv
+
+A reference CSV must provide the batch input columns
+(Environment, UNS, Temperature (deg C), Concentration_clean, comment).
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add src to python path to mimic app behavior
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+from config.config import BATCH_INPUT_COLUMNS, COMMENT_COLUMN
+from utils.predictor import CorrosionClassifier
+from utils.processors import clean_condition_text, get_scibert_embeddings
+from utils.scibert_backends import BACKENDS
+from utils.vars import environment, uns_nums
+
+_DEFAULT_DESCRIPTIONS = [
+    "high chloride seawater with intermittent wetting",
+    "aerated solution at boiling point",
+    "deaerated acid with trace ferric ions",
+    "stagnant conditions under deposits",
+    "high velocity flow with entrained solids",
+    "vapour phase above condensing liquid",
+    "dilute solution at room temperature",
+    "concentrated solution with oxidizing impurities",
+]
+
+
+def default_reference_set() -> pd.DataFrame:
+    """Small built-in reference set crossing sample descriptions with inputs."""
+    rows = []
+    for i, comment in enumerate(_DEFAULT_DESCRIPTIONS):
+        for j in range(4):
+            rows.append(
+                {
+                    "Environment": environment[(i * 7 + j) % len(environment)],
+                    "UNS": uns_nums[(i * 11 + j * 3) % len(uns_nums)],
+                    "Temperature (deg C)": 20 + 25 * j,
+                    "Concentration_clean": 5 + 10 * i,
+                    COMMENT_COLUMN: comment,
+                }
+            )
+    return pd.DataFrame(rows, columns=BATCH_INPUT_COLUMNS)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backend", choices=BACKENDS, required=True)
+    parser.add_argument("--reference", help="CSV of reference inputs")
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.reference) if args.reference else default_reference_set()
+    texts = [clean_condition_text(str(c)) for c in df[COMMENT_COLUMN]]
+
+    reference = get_scibert_embeddings(texts, backend="torch")
+    candidate = get_scibert_embeddings(texts, backend=args.backend)
+
+    cosine = np.sum(reference * candidate, axis=1) / (
+        np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    )
+    clf = CorrosionClassifier()
+    ref_pca = clf.compiled["pca"](reference)
+    cand_pca = clf.compiled["pca"](candidate)
+
+    tabular = (
+        df["Environment"],
+        df["UNS"],
+        df["Temperature (deg C)"],
+        df["Concentration_clean"],
+    )
+    ref_labels = clf.predict_features(clf.assemble_features(*tabular, ref_pca))
+    cand_labels = clf.predict_features(clf.assemble_features(*tabular, cand_pca))
+    changed = [i for i, (a, b) in enumerate(zip(ref_labels, cand_labels)) if a != b]
+
+    print(f"---- SciBERT Drift: torch → {args.backend} ({len(df)} rows) ----")
+    print(f"  - cosine similarity: min {cosine.min():.6f}, mean {cosine.mean():.6f}")
+    print(f"  - embedding max |Δ|: {np.max(np.abs(reference - candidate)):.3g}")
+    print(f"  - PCA-space max |Δ|: {np.max(np.abs(ref_pca - cand_pca)):.3g}")
+    print(f"  - predicted class changes: {len(changed)}")
+    for i in changed:
+        print(f"    · row {i}: {ref_labels[i]} → {cand_labels[i]}")
+    return 1 if changed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
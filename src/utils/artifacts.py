@@ -0,0 +1,255 @@
+"""
+Model artifact manifest, integrity checks and instrumented parallel loading.
+
+The manifest (``models/manifest.json``) records, for each artifact in
+``MODEL_PATHS``, its path relative to ``BASE_PATH``, SHA-256, size in bytes and
+the fully qualified type of the pickled top-level object. Verification reads
+the type from the pickle stream without unpickling, so it needs neither
+scikit-learn nor the app.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickletools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1 << 20
+_STRING_OPCODES = {"SHORT_BINUNICODE", "BINUNICODE", "BINUNICODE8", "UNICODE"}
+
+
+def artifact_digest(path: str) -> str:
+    """Return the hex SHA-256 of a model artifact file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def pickle_globals(path: str) -> Iterator[str]:
+    """Yield the module.name of every global a pickle references, in stream order.
+
+    Stops quietly at raw data that is not pickle opcodes, such as the array
+    buffers joblib appends.
+    """
+    strings: list[str] = []
+    with open(path, "rb") as f:
+        try:
+            for opcode, arg, _ in pickletools.genops(f):
+                if opcode.name in _STRING_OPCODES:
+                    strings.append(arg)
+                elif opcode.name == "STACK_GLOBAL" and len(strings) >= 2:
+                    yield ".".join(strings[-2:])
+                elif opcode.name == "GLOBAL":
+                    yield arg.replace(" ", ".")
+        except ValueError:
+            return
+
+
+def pickled_type(path: str) -> str:
+    """Return the qualified type of a pickle's top-level object without unpickling."""
+    found = next(pickle_globals(path), None)
+    if found is None:
+        raise ValueError(f"No class reference found in pickle: {path}")
+    return found
+
+
+def object_type(obj) -> str:
+    """Return the qualified type name of a loaded object, matching ``pickled_type``."""
+    return f"{type(obj).__module__}.{type(obj).__qualname__}"
+
+
+# ---- Manifest ----
+
+
+def build_manifest(paths: dict[str, str], base_path: str) -> dict:
+    """Describe every artifact in ``paths`` (path, sha256, size, type)."""
+    return {
+        "artifacts": {
+            name: {
+                "path": os.path.relpath(path, base_path).replace(os.sep, "/"),
+                "sha256": artifact_digest(path),
+                "size": os.path.getsize(path),
+                "type": pickled_type(path),
+            }
+            for name, path in paths.items()
+        }
+    }
+
+
+def write_manifest(manifest: dict, manifest_path: str) -> None:
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def read_manifest(manifest_path: str) -> dict | None:
+    """Read the manifest, or return None if it has not been generated."""
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def source_digests(paths: dict[str, str], manifest: dict | None) -> dict[str, str]:
+    """SHA-256 per artifact: the manifest's when listed, else the file's own."""
+    entries = (manifest or {}).get("artifacts", {})
+    return {
+        name: entries[name]["sha256"] if name in entries else artifact_digest(path)
+        for name, path in paths.items()
+    }
+
+
+def verify_artifact(
+    path: str, entry: dict | None, check_type: bool = True
+) -> list[str]:
+    """Return a list of problems with an artifact file against its manifest entry."""
+    if entry is None:
+        return ["missing from manifest"]
+    if not os.path.exists(path):
+        return [f"file not found: {path}"]
+
+    problems = []
+    size = os.path.getsize(path)
+    if size != entry["size"]:
+        problems.append(f"size {size} != manifest {entry['size']}")
+    elif artifact_digest(path) != entry["sha256"]:
+        problems.append("sha256 mismatch")
+    if check_type and not problems:
+        found = pickled_type(path)
+        if found != entry["type"]:
+            problems.append(f"type {found} != manifest {entry['type']}")
+    return problems
+
+
+# ---- Instrumented Loading ----
+
+
+@dataclass
+class LoadReport:
+    """Timing and memory footprint of one loaded artifact."""
+
+    name: str
+    path: str
+    seconds: float
+    nbytes: int
+    verified: bool
+    sha256: str
+
+
+def load_artifacts(
+    paths: dict[str, str],
+    manifest: dict | None = None,
+    max_workers: int | None = None,
+) -> tuple[dict, list[LoadReport]]:
+    """Verify and load artifacts in parallel threads.
+
+    Raises ``ValueError`` if an artifact does not match its manifest entry.
+    Artifacts without an entry (or without any manifest) are loaded unverified
+    with a warning; their checksum is computed from the file instead.
+    """
+    entries = (manifest or {}).get("artifacts", {})
+    if manifest is None:
+        logger.warning("No artifact manifest found; loading without verification")
+
+    def load_one(name: str, path: str) -> tuple[object, LoadReport]:
+        import joblib
+
+        start = time.perf_counter()
+        entry = entries.get(name)
+        if entry is None and manifest is not None:
+            logger.warning("Artifact '%s' is not in the manifest; not verified", name)
+        if entry is not None:
+            problems = verify_artifact(path, entry, check_type=False)
+            if problems:
+                raise ValueError(f"Artifact '{name}' failed verification: {problems}")
+        obj = joblib.load(path)
+        if entry is not None and object_type(obj) != entry["type"]:
+            raise ValueError(
+                f"Artifact '{name}' is a {object_type(obj)}, "
+                f"manifest expects {entry['type']}"
+            )
+        report = LoadReport(
+            name=name,
+            path=path,
+            seconds=time.perf_counter() - start,
+            nbytes=estimate_nbytes(obj),
+            verified=entry is not None,
+            sha256=entry["sha256"] if entry is not None else artifact_digest(path),
+        )
+        return obj, report
+
+    rss_before = current_rss_bytes()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers or len(paths) or 1) as pool:
+        futures = {
+            name: pool.submit(load_one, name, path) for name, path in paths.items()
+        }
+        results = {name: future.result() for name, future in futures.items()}
+    elapsed = time.perf_counter() - start
+    rss_after = current_rss_bytes()
+
+    loaded = {name: obj for name, (obj, _) in results.items()}
+    reports = [report for _, report in results.values()]
+    for report in reports:
+        logger.info(
+            "Loaded artifact '%s' in %.3fs (~%.1f MB%s)",
+            report.name,
+            report.seconds,
+            report.nbytes / 1e6,
+            ", verified" if report.verified else "",
+        )
+    if rss_before is not None and rss_after is not None:
+        logger.info(
+            "Loaded %d artifacts in %.3fs; process RSS %.1f → %.1f MB",
+            len(loaded),
+            elapsed,
+            rss_before / 1e6,
+            rss_after / 1e6,
+        )
+    return loaded, reports
+
+
+def current_rss_bytes() -> int | None:
+    """Current resident set size of this process, or None if unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def estimate_nbytes(obj, _seen: set | None = None) -> int:
+    """Approximate in-memory size of a fitted model from the arrays it holds."""
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if hasattr(obj, "memory_usage") and hasattr(obj, "index"):  # pandas objects
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if isinstance(obj, dict):
+        return sum(estimate_nbytes(v, seen) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(estimate_nbytes(v, seen) for v in obj)
+    if hasattr(obj, "__dict__"):
+        return estimate_nbytes(vars(obj), seen)
+    if hasattr(obj, "__getstate__"):  # extension types such as sklearn's Tree
+        try:
+            state = obj.__getstate__()
+        except TypeError:
+            return 0
+        return estimate_nbytes(state, seen) if isinstance(state, dict) else 0
+    return 0
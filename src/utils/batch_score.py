@@ -0,0 +1,336 @@
+"""
+Headless batch scorer for CSV and Parquet files.
+
+Reads the input in fixed-size chunks, scores each chunk with
+``CorrosionClassifier`` and appends the rows plus ``prediction`` and ``error``
+columns to the output, so memory stays bounded by the chunk size whatever the
+file size. Rows that fail validation (non-numeric or non-finite temperature or
+concentration, unknown environment or alloy, empty description) are not
+scored: their prediction is empty and ``error`` says why.
+
+Progress is checkpointed to ``<output>.checkpoint.json`` after every chunk.
+Re-running the same command resumes after the last completed chunk; a
+checkpoint written for a different input file or chunk size is rejected.
+Parquet output is written as one part file per chunk under ``<output>.parts/``
+and merged into the final file when the run completes.
+
+With ``--workers N`` (N > 1) each chunk is split across a pool of N worker
+processes that is kept for the whole run (see ``utils.parallel``).
+
+Usage (from src/):
+    python -m utils.batch_score in.parquet out.parquet [--chunk-rows N]
+        [--mode batch|pipeline] [--workers N] [--restart]
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import time
+from collections import deque
+from contextlib import ExitStack
+from typing import Iterator
+
+import pandas as pd
+
+from config.config import BATCH_INPUT_COLUMNS, BATCH_SCORE_CHUNK_ROWS
+from utils.bulk import missing_columns, validate_rows
+
+logger = logging.getLogger(__name__)
+
+PREDICTION_COLUMN = "prediction"
+ERROR_COLUMN = "error"
+_OUTPUT_COLUMNS = BATCH_INPUT_COLUMNS + [PREDICTION_COLUMN, ERROR_COLUMN]
+
+_CSV_SUFFIXES = (".csv",)
+_PARQUET_SUFFIXES = (".parquet", ".pq")
+# Schema unification with promote_options (see _output_schema) needs 14.0
+_MIN_PYARROW_VERSION = (14, 0)
+
+
+def file_format(path: str) -> str:
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix in _CSV_SUFFIXES:
+        return "csv"
+    if suffix in _PARQUET_SUFFIXES:
+        return "parquet"
+    raise ValueError(f"Unsupported file type '{suffix}'; use .csv or .parquet")
+
+
+def require_parquet_support() -> None:
+    """Fail unless a pyarrow new enough for Parquet input and output is installed."""
+    minimum = ".".join(map(str, _MIN_PYARROW_VERSION))
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ValueError(f"Parquet files need pyarrow>={minimum}") from None
+    version = tuple(int(part) for part in pa.__version__.split(".")[:2])
+    if version < _MIN_PYARROW_VERSION:
+        raise ValueError(
+            f"Parquet files need pyarrow>={minimum}; found {pa.__version__}"
+        )
+
+
+def read_chunks(path: str, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """Yield the input file as DataFrames of at most ``chunk_rows`` rows."""
+    if file_format(path) == "csv":
+        yield from pd.read_csv(path, chunksize=chunk_rows)
+        return
+
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(path)
+    for batch in parquet.iter_batches(batch_size=chunk_rows):
+        yield batch.to_pandas()
+
+
+# ---- Checkpoints ----
+
+
+def _checkpoint_path(output: str) -> str:
+    return f"{output}.checkpoint.json"
+
+
+def _parts_dir(output: str) -> str:
+    return f"{output}.parts"
+
+
+def _input_signature(path: str, chunk_rows: int) -> dict:
+    stat = os.stat(path)
+    return {
+        "input": os.path.abspath(path),
+        "input_size": stat.st_size,
+        "input_mtime": stat.st_mtime,
+        "chunk_rows": chunk_rows,
+    }
+
+
+def load_checkpoint(output: str, signature: dict) -> dict:
+    """Return the saved progress for this run, or a fresh one."""
+    fresh = {**signature, "chunks_done": 0, "rows_done": 0, "output_bytes": 0}
+    path = _checkpoint_path(output)
+    if not os.path.exists(path):
+        return fresh
+    with open(path, encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    if any(checkpoint.get(key) != value for key, value in signature.items()):
+        raise ValueError(
+            f"Checkpoint {path} was written for a different input or chunk size; "
+            "pass --restart to start over"
+        )
+    return checkpoint
+
+
+def save_checkpoint(output: str, checkpoint: dict) -> None:
+    """Write the checkpoint atomically so a crash never leaves it half-written."""
+    path = _checkpoint_path(output)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def clear_run_state(output: str) -> None:
+    for path in (output, _checkpoint_path(output)):
+        if os.path.exists(path):
+            os.remove(path)
+    shutil.rmtree(_parts_dir(output), ignore_errors=True)
+
+
+# ---- Output ----
+
+
+def write_chunk(output: str, scored: pd.DataFrame, index: int, checkpoint: dict):
+    """Append one scored chunk to the output and record its position."""
+    if file_format(output) == "csv":
+        with open(output, "r+b" if os.path.exists(output) else "wb") as f:
+            # Drop anything written after the last checkpoint by a crashed run
+            f.truncate(checkpoint["output_bytes"])
+            f.seek(checkpoint["output_bytes"])
+            scored.to_csv(f, header=index == 0, index=False)
+            checkpoint["output_bytes"] = f.tell()
+        return
+
+    os.makedirs(_parts_dir(output), exist_ok=True)
+    scored.to_parquet(
+        os.path.join(_parts_dir(output), f"part-{index:06d}.parquet"), index=False
+    )
+
+
+def finalize_output(output: str, n_chunks: int) -> None:
+    """Merge Parquet part files into the output file, one row group per part."""
+    if file_format(output) == "csv":
+        if not os.path.exists(output):
+            pd.DataFrame(columns=_OUTPUT_COLUMNS).to_csv(output, index=False)
+        return
+
+    import pyarrow.parquet as pq
+
+    parts = [
+        os.path.join(_parts_dir(output), f"part-{i:06d}.parquet")
+        for i in range(n_chunks)
+    ]
+    if not parts:
+        pd.DataFrame(columns=_OUTPUT_COLUMNS).to_parquet(output, index=False)
+        return
+    schema = _output_schema(parts)
+    with pq.ParquetWriter(output, schema) as writer:
+        for part in parts:
+            writer.write_table(pq.read_table(part).cast(schema))
+    shutil.rmtree(_parts_dir(output))
+
+
+def _output_schema(parts: list[str]):
+    """One schema every part can be cast to.
+
+    Scored columns get fixed types. Any other column takes the type unified
+    across all parts, so a chunk where it is all null (inferred as ``null``)
+    or all integer does not decide the type for the whole file.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    fixed = {
+        "Temperature (deg C)": pa.float64(),
+        "Concentration_clean": pa.float64(),
+        PREDICTION_COLUMN: pa.string(),
+        ERROR_COLUMN: pa.string(),
+    }
+    schema = pa.unify_schemas(
+        [pq.read_schema(part).remove_metadata() for part in parts],
+        promote_options="permissive",
+    )
+    for name, type_ in fixed.items():
+        index = schema.get_field_index(name)
+        if index >= 0:
+            schema = schema.set(index, pa.field(name, type_))
+    return schema
+
+
+# ---- Scoring ----
+
+
+def score_file(
+    input_path: str,
+    output_path: str,
+    chunk_rows: int = BATCH_SCORE_CHUNK_ROWS,
+    mode: str = "batch",
+    workers: int = 1,
+) -> int:
+    """Score ``input_path`` into ``output_path``, resuming from a checkpoint.
+
+    ``workers`` > 1 scores each chunk on a process pool (batch mode only).
+    Returns the total number of rows scored.
+    """
+    from utils.parallel import ParallelScorer
+    from utils.pipeline import PipelineExecutor
+    from utils.predictor import CorrosionClassifier
+
+    if workers > 1 and mode != "batch":
+        raise ValueError("--workers is only supported with --mode batch")
+    formats = {file_format(input_path), file_format(output_path)}
+    if "parquet" in formats:
+        require_parquet_support()  # before any chunk is scored, not at the merge
+    checkpoint = load_checkpoint(output_path, _input_signature(input_path, chunk_rows))
+    done = checkpoint["chunks_done"]
+    if done:
+        logger.info(
+            "Resuming after chunk %d (%d rows already scored)",
+            done,
+            checkpoint["rows_done"],
+        )
+
+    # Chunks (and their row errors) handed to the scorer and not yet written
+    in_flight: deque[tuple[pd.DataFrame, pd.Series]] = deque()
+
+    def pending_chunks() -> Iterator[pd.DataFrame]:
+        """Yield the valid rows of each chunk still to be scored."""
+        for i, chunk in enumerate(read_chunks(input_path, chunk_rows)):
+            if i < done:
+                continue
+            missing = missing_columns(chunk)
+            if missing:
+                raise ValueError(f"Batch input is missing columns: {missing}")
+            errors = validate_rows(chunk)
+            in_flight.append((chunk, errors))
+            yield chunk.loc[(errors == "").to_numpy(), BATCH_INPUT_COLUMNS]
+
+    with ExitStack() as stack:
+        if workers > 1:
+            scorer = stack.enter_context(ParallelScorer(workers))
+            labelled = (scorer.score(chunk) for chunk in pending_chunks())
+        elif mode == "pipeline":
+            labelled = PipelineExecutor(CorrosionClassifier()).run(pending_chunks())
+        else:
+            clf = CorrosionClassifier()
+            labelled = (clf.predict_batch(chunk)[0] for chunk in pending_chunks())
+
+        index, rows_this_run = done, 0
+        start = time.perf_counter()
+        for labels in labelled:
+            chunk, errors = in_flight.popleft()
+            predictions = pd.Series(None, index=chunk.index, dtype=object)
+            predictions[(errors == "").to_numpy()] = labels.to_numpy()
+            scored = chunk.assign(
+                **{PREDICTION_COLUMN: predictions, ERROR_COLUMN: errors}
+            )
+            write_chunk(output_path, scored, index, checkpoint)
+            index += 1
+            rows_this_run += len(scored)
+            checkpoint["chunks_done"] = index
+            checkpoint["rows_done"] += len(scored)
+            save_checkpoint(output_path, checkpoint)
+            logger.info(
+                "Chunk %d: %d rows, %d invalid (%d total, %.0f rows/s)",
+                index,
+                len(scored),
+                int((errors != "").sum()),
+                checkpoint["rows_done"],
+                rows_this_run / max(time.perf_counter() - start, 1e-9),
+            )
+
+    finalize_output(output_path, index)
+    os.remove(_checkpoint_path(output_path))
+    return checkpoint["rows_done"]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("input", help="input .csv or .parquet file")
+    parser.add_argument("output", help="output .csv or .parquet file")
+    parser.add_argument("--chunk-rows", type=int, default=BATCH_SCORE_CHUNK_ROWS)
+    parser.add_argument(
+        "--mode",
+        choices=("batch", "pipeline"),
+        default="batch",
+        help="score chunks one after another, or with overlapping stages",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="score each chunk on this many worker processes (batch mode)",
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="discard any checkpoint and start over"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(message)s")
+
+    if args.restart:
+        clear_run_state(args.output)
+    try:
+        rows = score_file(
+            args.input, args.output, args.chunk_rows, args.mode, args.workers
+        )
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    print(f"✅ Scored {rows} rows into {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
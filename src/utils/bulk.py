@@ -0,0 +1,80 @@
+"""
+Column normalisation and row validation for uploaded batch files.
+"""
+
+import numpy as np
+import pandas as pd
+
+from config.config import BATCH_INPUT_COLUMNS, COMMENT_COLUMN
+from utils.vars import environment, uns_nums
+
+PREDICTION_COLUMN = "Predicted Corrosion Rate"
+ERROR_COLUMN = "Validation Error"
+
+# Accepted header spellings (case-insensitive) for each model input column
+_COLUMN_ALIASES = {
+    "environment": "Environment",
+    "env": "Environment",
+    "uns": "UNS",
+    "alloy uns": "UNS",
+    "temperature": "Temperature (deg C)",
+    "temperature (deg c)": "Temperature (deg C)",
+    "temperature (°c)": "Temperature (deg C)",
+    "temp": "Temperature (deg C)",
+    "concentration": "Concentration_clean",
+    "concentration_clean": "Concentration_clean",
+    "concentration (%)": "Concentration_clean",
+    "conc": "Concentration_clean",
+    "comment": COMMENT_COLUMN,
+    "description": COMMENT_COLUMN,
+    "condition description": COMMENT_COLUMN,
+}
+
+_ENVIRONMENTS = frozenset(environment)
+_UNS_NUMS = frozenset(uns_nums)
+
+
+def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Rename recognised header spellings to the model's input column names."""
+    renames = {
+        column: _COLUMN_ALIASES[column.strip().lower()]
+        for column in df.columns
+        if column.strip().lower() in _COLUMN_ALIASES
+    }
+    return df.rename(columns=renames)
+
+
+def missing_columns(df: pd.DataFrame) -> list[str]:
+    return [column for column in BATCH_INPUT_COLUMNS if column not in df.columns]
+
+
+def validate_rows(df: pd.DataFrame) -> pd.Series:
+    """Return a per-row error message; empty string for rows that can be scored.
+
+    Expects normalised columns. Temperature and concentration are coerced to
+    numbers in place.
+    """
+    errors = pd.Series("", index=df.index, dtype=object)
+
+    def flag(mask, message: str) -> None:
+        mask = np.asarray(mask) & (errors == "").to_numpy()
+        errors[mask] = message
+
+    flag(~df["Environment"].isin(_ENVIRONMENTS), "unknown Environment")
+    flag(~df["UNS"].isin(_UNS_NUMS), "unknown UNS")
+    for column in ("Temperature (deg C)", "Concentration_clean"):
+        df[column] = pd.to_numeric(df[column], errors="coerce")
+        # NaN and ±inf would be routed arbitrarily by the forest
+        flag(
+            ~np.isfinite(df[column].to_numpy(dtype=np.float64)),
+            f"{column} is not a number",
+        )
+    flag(
+        ~df["Concentration_clean"].between(0, 100),
+        "Concentration_clean outside 0-100",
+    )
+    flag(
+        df[COMMENT_COLUMN].fillna("").astype(str).str.strip() == "",
+        "empty description",
+    )
+    return errors
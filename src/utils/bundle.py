@@ -0,0 +1,104 @@
+"""
+Single-file, memory-mappable inference bundle.
+
+The bundle holds every compiled pipeline component (encoder lookup tables,
+temperature scaler, PCA projection, flattened forest) as raw NumPy arrays
+behind a JSON header. Opening it maps the file read-only, so startup does no
+unpickling and every worker process on a host shares the same pages through
+the OS page cache.
+
+Layout: ``MAGIC | uint64 header length | JSON header | arrays``, with each
+array aligned to 64 bytes from the start of the data section.
+"""
+
+import json
+import logging
+import struct
+
+import numpy as np
+
+from utils.compiled import LookupEncoder, PCAProjector, ScalerTransform
+from utils.forest import CompiledForest
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"CRBNDL01"
+_ALIGNMENT = 64
+_COMPONENTS = {
+    "env_encoder": LookupEncoder,
+    "uns_encoder": LookupEncoder,
+    "temp_scaler": ScalerTransform,
+    "pca": PCAProjector,
+    "model": CompiledForest,
+}
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def write_bundle(compiled: dict, path: str, metadata: dict | None = None) -> None:
+    """Serialise compiled pipeline components into one flat bundle file."""
+    arrays = {}
+    for name, cls in _COMPONENTS.items():
+        if not isinstance(compiled.get(name), cls):
+            raise ValueError(f"Bundle component '{name}' must be a {cls.__name__}")
+        for key, array in compiled[name].to_arrays().items():
+            arrays[f"{name}/{key}"] = np.ascontiguousarray(array)
+
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        offset = _align(offset)
+        layout[name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+        }
+        offset += array.nbytes
+
+    header = json.dumps(
+        {"arrays": layout, "metadata": metadata or {}}, sort_keys=True
+    ).encode("utf-8")
+    data_start = _align(len(_MAGIC) + 8 + len(header))
+
+    with open(path, "wb") as f:
+        f.write(_MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name]["offset"])
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+    logger.info(
+        "Wrote inference bundle %s (%.1f MB)", path, (data_start + offset) / 1e6
+    )
+
+
+def _read_header(path: str) -> tuple[dict, int]:
+    with open(path, "rb") as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"Not an inference bundle: {path}")
+        (header_len,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_len).decode("utf-8"))
+    return header, _align(len(_MAGIC) + 8 + header_len)
+
+
+def open_bundle(path: str) -> tuple[dict, dict]:
+    """Map a bundle read-only and rebuild its components; return (compiled, metadata)."""
+    header, data_start = _read_header(path)
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+
+    grouped: dict[str, dict[str, np.ndarray]] = {}
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        start = data_start + spec["offset"]
+        size = int(np.prod(spec["shape"], dtype=np.int64)) * dtype.itemsize
+        array = raw[start : start + size].view(dtype).reshape(spec["shape"])
+        component, key = name.split("/", 1)
+        grouped.setdefault(component, {})[key] = array
+
+    compiled = {
+        name: cls.from_arrays(grouped[name]) for name, cls in _COMPONENTS.items()
+    }
+    logger.info("Opened inference bundle %s", path)
+    return compiled, header["metadata"]
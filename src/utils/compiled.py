@@ -0,0 +1,186 @@
+"""
+Array-backed equivalents of the fitted preprocessing transforms.
+
+Each class here extracts the learned parameters from a scikit-learn /
+category_encoders object once and applies them with plain NumPy, avoiding
+per-call DataFrame construction and feature-name validation.
+"""
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from utils.forest import CompiledForest
+from utils.vars import environment, uns_nums
+
+# Category value guaranteed not to appear in the training data
+_UNKNOWN_CATEGORY = "__unknown_category__"
+
+
+class PCAProjector:
+    """Fused ``PCA.transform``: a single float32 ``X @ W - b`` over a batch."""
+
+    def __init__(self, weights: np.ndarray, bias: np.ndarray):
+        self.weights = weights
+        self.bias = bias
+        self.n_features_in = self.weights.shape[0]
+        self.n_components = self.weights.shape[1]
+
+    @classmethod
+    def from_pca(cls, pca) -> "PCAProjector":
+        components = np.asarray(pca.components_, dtype=np.float64)
+        if getattr(pca, "whiten", False):
+            components = components / np.sqrt(pca.explained_variance_)[:, np.newaxis]
+        # Same algebra as sklearn: X @ C.T - mean @ C.T
+        weights = np.ascontiguousarray(components.T, dtype=np.float32)
+        bias = (np.asarray(pca.mean_, dtype=np.float64) @ components.T).astype(
+            np.float32
+        )
+        return cls(weights, bias)
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        return {"weights": self.weights, "bias": self.bias}
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray]) -> "PCAProjector":
+        return cls(arrays["weights"], arrays["bias"])
+
+    def __call__(self, embeddings: np.ndarray) -> np.ndarray:
+        """Project an (n, n_features_in) embedding batch to (n, n_components)."""
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if embeddings.ndim != 2 or embeddings.shape[1] != self.n_features_in:
+            raise ValueError(
+                f"Expected embeddings of shape (n, {self.n_features_in}), "
+                f"got {embeddings.shape}"
+            )
+        projected = embeddings @ self.weights
+        projected -= self.bias
+        return projected
+
+
+class ScalerTransform:
+    """Fused single-column ``StandardScaler.transform``: ``(x - mean) / scale``."""
+
+    def __init__(self, mean: float, scale: float):
+        self.mean = float(mean)
+        self.scale = float(scale)
+
+    @classmethod
+    def from_scaler(cls, scaler) -> "ScalerTransform":
+        return cls(
+            mean=scaler.mean_[0] if scaler.with_mean else 0.0,
+            scale=scaler.scale_[0] if scaler.with_std else 1.0,
+        )
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        return {"params": np.array([self.mean, self.scale], dtype=np.float64)}
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray]) -> "ScalerTransform":
+        mean, scale = arrays["params"]
+        return cls(mean, scale)
+
+    def __call__(self, values: np.ndarray) -> np.ndarray:
+        """Scale a 1-D array of raw values."""
+        scaled = np.asarray(values, dtype=np.float64) - self.mean
+        scaled /= self.scale
+        return scaled
+
+
+class LookupEncoder:
+    """Category encoder precompiled into a flat lookup table over a closed domain.
+
+    ``table`` holds one encoded value per category followed by the encoder's
+    unknown-category fallback. Encoding is a dict lookup per value followed by
+    a vectorized gather.
+    """
+
+    def __init__(
+        self,
+        column: str,
+        categories: list[str],
+        table: np.ndarray,
+        reject_unknown: bool = False,
+    ):
+        self.column = column
+        self.categories = list(categories)
+        self._codes = {category: i for i, category in enumerate(self.categories)}
+        self._unknown_code = len(self.categories)
+        self._table = table
+        self._reject_unknown = reject_unknown
+
+    @classmethod
+    def from_encoder(
+        cls, encoder, column: str, categories: Iterable[str]
+    ) -> "LookupEncoder":
+        """Run a fitted encoder once over every known category and one unseen value."""
+        categories = list(dict.fromkeys(categories))
+        known = _transform_column(encoder, column, categories)
+        try:
+            unknown = _transform_column(encoder, column, [_UNKNOWN_CATEGORY])[0]
+            reject_unknown = False
+        except Exception:  # encoder configured with handle_unknown="error"
+            unknown = np.nan
+            reject_unknown = True
+        return cls(column, categories, np.append(known, unknown), reject_unknown)
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        return {
+            "column": np.array([self.column]),
+            "categories": np.array(self.categories, dtype=str),
+            "table": self._table,
+            "reject_unknown": np.array([self._reject_unknown]),
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray]) -> "LookupEncoder":
+        return cls(
+            str(arrays["column"][0]),
+            [str(category) for category in arrays["categories"]],
+            arrays["table"],
+            bool(arrays["reject_unknown"][0]),
+        )
+
+    def __call__(self, values) -> np.ndarray:
+        """Encode an iterable of raw category values."""
+        values = list(values)
+        codes = np.fromiter(
+            (self._codes.get(value, self._unknown_code) for value in values),
+            dtype=np.intp,
+            count=len(values),
+        )
+        if self._reject_unknown and (codes == self._unknown_code).any():
+            unknown = {v for v, c in zip(values, codes) if c == self._unknown_code}
+            raise ValueError(f"Unknown {self.column} categories: {sorted(unknown)}")
+        return self._table[codes]
+
+
+def compile_pipeline(models: dict) -> dict:
+    """Build array-backed versions of every fitted artifact in ``models``."""
+    return {
+        "env_encoder": LookupEncoder.from_encoder(
+            models["env_encoder"], "Environment", environment
+        ),
+        "uns_encoder": LookupEncoder.from_encoder(
+            models["uns_encoder"], "UNS", uns_nums
+        ),
+        "pca": PCAProjector.from_pca(models["pca"]),
+        "temp_scaler": ScalerTransform.from_scaler(models["temp_scaler"]),
+        "model": CompiledForest.from_sklearn(models["model"]).compact(),
+    }
+
+
+def _transform_column(encoder, column: str, values: list) -> np.ndarray:
+    """Run a fitted category encoder over one column, returning a float array."""
+    encoded = encoder.transform(pd.Series(values, dtype=object, name=column))
+    return np.asarray(encoded, dtype=np.float64).ravel()
+
+
+def max_encoder_deviation(
+    encoder, lookup: LookupEncoder, values: Iterable[str]
+) -> float:
+    """Largest absolute difference between a fitted encoder and its lookup table."""
+    values = list(values)
+    expected = _transform_column(encoder, lookup.column, values)
+    return float(np.max(np.abs(expected - lookup(values)), initial=0.0))
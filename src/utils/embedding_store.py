@@ -0,0 +1,178 @@
+"""
+Persistent, memory-mapped vector store for text embeddings.
+
+Vectors live in a fixed-capacity float32 matrix on disk, next to a parallel
+array of key digests. The matrix is written append-only as a ring buffer: once
+the size cap is reached the oldest entry is evicted. The in-memory hash index
+is rebuilt from the key file on open, so a restarted process starts warm.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Sequence
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_DIGEST_SIZE = 16
+# Header layout: [dim, capacity, cursor]
+_HEADER_FIELDS = 3
+
+
+class EmbeddingStore:
+    """Fixed-capacity, disk-backed float32 vector store keyed by text."""
+
+    def __init__(self, directory: str, dim: int, capacity: int, namespace: str = ""):
+        if dim <= 0 or capacity <= 0:
+            raise ValueError("EmbeddingStore dim and capacity must be positive.")
+        self.directory = directory
+        self.dim = dim
+        self.capacity = capacity
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._index: dict[bytes, int] = {}
+
+        os.makedirs(directory, exist_ok=True)
+        self._lock_path = os.path.join(directory, "store.lock")
+        with self._file_lock():
+            self._open_files()
+        self._rebuild_index()
+        logger.info(
+            "Opened embedding store %s (%d/%d entries, dim=%d)",
+            directory,
+            len(self._index),
+            capacity,
+            dim,
+        )
+
+    # ---- Files ----
+
+    def _open_files(self) -> None:
+        """Map the header, key and vector files, recreating them on a layout change."""
+        header_path = os.path.join(self.directory, "header.i64")
+        keys_path = os.path.join(self.directory, "keys.u8")
+        vectors_path = os.path.join(self.directory, "vectors.f32")
+
+        reuse = all(os.path.exists(p) for p in (header_path, keys_path, vectors_path))
+        if reuse:
+            header = np.memmap(header_path, dtype=np.int64, mode="r+")
+            reuse = header.shape == (_HEADER_FIELDS,) and (
+                int(header[0]) == self.dim and int(header[1]) == self.capacity
+            )
+            if not reuse:
+                logger.warning(
+                    "Embedding store layout changed; recreating %s", self.directory
+                )
+                del header
+
+        mode = "r+" if reuse else "w+"
+        self._header = np.memmap(
+            header_path, dtype=np.int64, mode=mode, shape=(_HEADER_FIELDS,)
+        )
+        self._keys = np.memmap(
+            keys_path, dtype=np.uint8, mode=mode, shape=(self.capacity, _DIGEST_SIZE)
+        )
+        self._vectors = np.memmap(
+            vectors_path, dtype=np.float32, mode=mode, shape=(self.capacity, self.dim)
+        )
+        if not reuse:
+            self._header[:] = (self.dim, self.capacity, 0)
+            self._header.flush()
+
+    @contextmanager
+    def _file_lock(self):
+        """Serialise writers across processes sharing the same directory."""
+        if fcntl is None:
+            yield
+            return
+        with open(self._lock_path, "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the digest → slot index from the key file."""
+        occupied = np.flatnonzero(self._keys.any(axis=1))
+        self._index = {self._keys[slot].tobytes(): int(slot) for slot in occupied}
+        self._cursor = int(self._header[2])
+
+    def _refresh_if_stale(self) -> None:
+        """Pick up entries appended by other processes since the last rebuild."""
+        if int(self._header[2]) != self._cursor:
+            self._rebuild_index()
+
+    # ---- Public API ----
+
+    def _digest(self, text: str) -> bytes:
+        payload = f"{self.namespace}\0{text}".encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=_DIGEST_SIZE).digest()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get_many(self, texts: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Look up texts; return (vectors, found_mask). Missing rows are zero.
+
+        Readers take no file lock, so another process may recycle a slot while
+        it is being copied. Writers clear a slot's key, then write the vector,
+        then the new key; a slot whose key matches both before and after the
+        copy therefore holds that key's vector. Any other slot is a miss.
+        """
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        found = np.zeros(len(texts), dtype=bool)
+        digests = [self._digest(text) for text in texts]
+        with self._lock:
+            self._refresh_if_stale()
+            for i, digest in enumerate(digests):
+                slot = self._index.get(digest)
+                if slot is None:
+                    continue
+                expected = np.frombuffer(digest, dtype=np.uint8)
+                if not np.array_equal(self._keys[slot], expected):
+                    continue  # evicted by another process before the copy
+                vectors[i] = self._vectors[slot]
+                if np.array_equal(self._keys[slot], expected):
+                    found[i] = True
+                else:
+                    vectors[i] = 0.0  # overwritten during the copy
+        return vectors, found
+
+    def put_many(self, texts: Sequence[str], vectors: np.ndarray) -> None:
+        """Append vectors for texts, evicting the oldest entries past capacity."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(texts), self.dim)
+        with self._lock, self._file_lock():
+            self._refresh_if_stale()
+            cursor = self._cursor
+            for text, vector in zip(texts, vectors):
+                digest = self._digest(text)
+                if digest in self._index:
+                    continue
+                slot = cursor % self.capacity
+                evicted = self._keys[slot].tobytes()
+                if any(evicted):
+                    self._index.pop(evicted, None)
+                    # Unpublish the old key first so concurrent readers
+                    # copying this slot see a mismatch rather than a torn vector
+                    self._keys[slot] = 0
+                # Write the vector before publishing its key in the slot
+                self._vectors[slot] = vector
+                self._keys[slot] = np.frombuffer(digest, dtype=np.uint8)
+                self._index[digest] = slot
+                cursor += 1
+            if cursor != self._cursor:
+                self._vectors.flush()
+                self._keys.flush()
+                self._header[2] = cursor
+                self._header.flush()
+                self._cursor = cursor
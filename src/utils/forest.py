@@ -0,0 +1,333 @@
+"""
+Array-backed evaluation of a fitted RandomForestClassifier.
+
+All trees are flattened into contiguous node arrays indexed globally across the
+forest. Leaves point to themselves, so traversal is a fixed number of gather
+steps with no per-node branching. Thresholds are stored as float32, rounded
+toward -inf so that ``x <= threshold`` gives the same decision as sklearn, which
+compares float32 features against float64 thresholds. Missing (NaN) feature
+values follow each node's learned ``missing_go_to_left`` direction, as in
+scikit-learn >= 1.3.
+
+``compact`` shrinks the arrays further without changing any prediction: node
+and feature indices use the smallest unsigned integer type that fits, and
+identical leaf distributions are stored once behind a per-node index.
+``prune`` optionally drops trees whose removal leaves every prediction on a
+holdout set unchanged.
+"""
+
+import numpy as np
+
+_TREE_LEAF = -1
+# Upper bound on (tree, row) pairs traversed together in one chunk
+_CHUNK_CELLS = 1 << 20
+# Trees evaluated between early-exit checks
+_EARLY_EXIT_BLOCK = 8
+
+
+class CompiledForest:
+    """A random forest flattened into feature/threshold/child/value arrays."""
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        value: np.ndarray,
+        roots: np.ndarray,
+        classes: np.ndarray,
+        max_depth: int,
+        value_index: np.ndarray | None = None,
+        missing_left: np.ndarray | None = None,
+    ):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.classes = classes
+        self.max_depth = int(max_depth)
+        # When set, ``value`` holds unique leaf rows and nodes index into it
+        self.value_index = value_index
+        # Per node, whether NaN goes left; None sends NaN right everywhere
+        self.missing_left = missing_left
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_classes(self) -> int:
+        return len(self.classes)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in self.to_arrays().values())
+
+    @classmethod
+    def from_sklearn(cls, forest) -> "CompiledForest":
+        """Flatten every fitted tree of a single-output forest classifier."""
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        missing_lefts = []
+        max_depth, offset = 0, 0
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            n_nodes = tree.node_count
+            node_ids = np.arange(offset, offset + n_nodes, dtype=np.int64)
+            is_leaf = tree.children_left == _TREE_LEAF
+
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(
+                _round_down_float32(np.where(is_leaf, 0.0, tree.threshold))
+            )
+            lefts.append(np.where(is_leaf, node_ids, tree.children_left + offset))
+            rights.append(np.where(is_leaf, node_ids, tree.children_right + offset))
+            # Absent before scikit-learn 1.3, where NaN inputs were rejected
+            missing_go_to_left = getattr(tree, "missing_go_to_left", None)
+            if missing_go_to_left is None:
+                missing_go_to_left = np.zeros(n_nodes, dtype=bool)
+            missing_lefts.append(~is_leaf & (np.asarray(missing_go_to_left) != 0))
+            # Normalise per node as DecisionTreeClassifier.predict_proba does
+            leaf_value = tree.value[:, 0, :]
+            totals = leaf_value.sum(axis=1, keepdims=True)
+            totals[totals == 0] = 1.0
+            values.append(leaf_value / totals)
+
+            roots.append(offset)
+            max_depth = max(max_depth, tree.max_depth)
+            offset += n_nodes
+
+        classes = np.asarray(forest.classes_)
+        if classes.dtype == object:  # keep classes storable in a flat bundle
+            classes = classes.astype(str)
+        return cls(
+            feature=np.concatenate(features).astype(np.int32),
+            threshold=np.concatenate(thresholds),
+            left=np.concatenate(lefts).astype(np.int32),
+            right=np.concatenate(rights).astype(np.int32),
+            value=np.concatenate(values).astype(np.float32),
+            roots=np.asarray(roots, dtype=np.int32),
+            classes=classes,
+            max_depth=max_depth,
+            missing_left=np.concatenate(missing_lefts),
+        )
+
+    def compact(self) -> "CompiledForest":
+        """Return an equivalent forest with the smallest index and value arrays.
+
+        Thresholds stay float32 and leaf values keep their exact float32
+        probabilities, so predictions are bit-for-bit unchanged.
+        """
+        node_ids = np.arange(self.n_nodes)
+        is_leaf = self.left == node_ids
+        leaf_rows = self._node_values(node_ids[is_leaf])
+        unique_rows, inverse = np.unique(leaf_rows, axis=0, return_inverse=True)
+        # Internal nodes are never read; point them at the first unique row
+        value_index = np.zeros(self.n_nodes, dtype=_smallest_uint(len(unique_rows)))
+        value_index[is_leaf] = inverse.ravel()
+
+        node_dtype = _smallest_uint(self.n_nodes)
+        return CompiledForest(
+            feature=self.feature.astype(_smallest_uint(int(self.feature.max()) + 1)),
+            threshold=self.threshold.astype(np.float32),
+            left=self.left.astype(node_dtype),
+            right=self.right.astype(node_dtype),
+            value=unique_rows.astype(np.float32),
+            roots=self.roots.astype(np.int32),
+            classes=self.classes,
+            max_depth=self.max_depth,
+            value_index=value_index,
+            missing_left=self.missing_left,
+        )
+
+    def select_trees(self, keep: np.ndarray) -> "CompiledForest":
+        """Return a forest made of the trees selected by the boolean mask ``keep``."""
+        keep = np.asarray(keep, dtype=bool)
+        ends = np.append(self.roots[1:], self.n_nodes)
+        nodes = np.concatenate(
+            [np.arange(start, end) for start, end in zip(self.roots[keep], ends[keep])]
+        )
+        remap = np.zeros(self.n_nodes, dtype=np.int64)
+        remap[nodes] = np.arange(len(nodes))
+        return CompiledForest(
+            feature=self.feature[nodes],
+            threshold=self.threshold[nodes],
+            left=remap[self.left[nodes]].astype(self.left.dtype),
+            right=remap[self.right[nodes]].astype(self.right.dtype),
+            value=self.value if self.value_index is not None else self.value[nodes],
+            roots=remap[self.roots[keep]].astype(np.int32),
+            classes=self.classes,
+            max_depth=self.max_depth,
+            value_index=(
+                None if self.value_index is None else self.value_index[nodes]
+            ),
+            missing_left=(
+                None if self.missing_left is None else self.missing_left[nodes]
+            ),
+        )
+
+    def prune(self, X_holdout: np.ndarray) -> "CompiledForest":
+        """Drop trees that do not change any prediction on a holdout set.
+
+        Trees are tried from last to first and removed greedily while the
+        argmax of the summed votes stays identical for every holdout row.
+        Dropping trees can still change predictions on other inputs, so the
+        holdout should be representative of production traffic.
+        """
+        votes = self._node_values(self.apply(X_holdout)).astype(np.float64)
+        total = votes.sum(axis=0)
+        reference = np.argmax(total, axis=1)
+        keep = np.ones(self.n_trees, dtype=bool)
+        for tree in range(self.n_trees - 1, -1, -1):
+            if keep.sum() == 1:
+                break
+            candidate = total - votes[tree]
+            if np.array_equal(np.argmax(candidate, axis=1), reference):
+                total = candidate
+                keep[tree] = False
+        return self.select_trees(keep)
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        arrays = {
+            "feature": self.feature,
+            "threshold": self.threshold,
+            "left": self.left,
+            "right": self.right,
+            "value": self.value,
+            "roots": self.roots,
+            "classes": self.classes,
+            "max_depth": np.array([self.max_depth], dtype=np.int32),
+        }
+        if self.value_index is not None:
+            arrays["value_index"] = self.value_index
+        if self.missing_left is not None:
+            arrays["missing_left"] = self.missing_left
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray]) -> "CompiledForest":
+        return cls(
+            feature=arrays["feature"],
+            threshold=arrays["threshold"],
+            left=arrays["left"],
+            right=arrays["right"],
+            value=arrays["value"],
+            roots=arrays["roots"],
+            classes=arrays["classes"],
+            max_depth=int(arrays["max_depth"][0]),
+            value_index=arrays.get("value_index"),
+            missing_left=arrays.get("missing_left"),
+        )
+
+    def apply(self, X: np.ndarray, roots: np.ndarray | None = None) -> np.ndarray:
+        """Return the leaf reached by each row in each tree, shape (n_trees, n_rows).
+
+        Every tree is traversed for the whole batch at once: each step gathers
+        one node per (tree, row) pair. Rows are processed in chunks to bound
+        the size of the (n_trees, n_rows) working arrays. NaN values take the
+        node's ``missing_left`` direction; the extra gather is only done for
+        batches that contain NaN.
+        """
+        X = np.asarray(X, dtype=np.float32)
+        missing = None
+        if self.missing_left is not None:
+            missing = np.isnan(X)
+            if not missing.any():
+                missing = None
+        roots = self.roots if roots is None else np.asarray(roots, dtype=np.int32)
+        n_rows = X.shape[0]
+        leaves = np.empty((len(roots), n_rows), dtype=np.int32)
+        chunk = max(1, _CHUNK_CELLS // max(1, len(roots)))
+
+        for start in range(0, n_rows, chunk):
+            rows = np.arange(start, min(start + chunk, n_rows))
+            node = np.repeat(roots[:, np.newaxis], len(rows), axis=1)
+            for _ in range(self.max_depth):
+                feature = self.feature[node]
+                go_left = X[rows, feature] <= self.threshold[node]
+                if missing is not None:
+                    go_left |= missing[rows, feature] & self.missing_left[node]
+                next_node = np.where(go_left, self.left[node], self.right[node])
+                if np.array_equal(next_node, node):  # every pair sits on a leaf
+                    break
+                node = next_node
+            leaves[:, rows] = node
+        return leaves
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Average the per-tree class probabilities, like sklearn's soft voting."""
+        leaves = self.apply(X)
+        proba = self._node_values(leaves).sum(axis=0, dtype=np.float64)
+        proba /= self.n_trees
+        return proba
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.classes.take(np.argmax(self.predict_proba(X), axis=1))
+
+    def predict_early_exit(
+        self, X: np.ndarray, block_size: int = _EARLY_EXIT_BLOCK
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Predict with early termination; return (classes, trees_used per row).
+
+        Trees are evaluated in blocks. Each tree adds at most 1 to any class's
+        probability sum, so a row stops once its leading class is ahead of the
+        runner-up by more than the number of trees still to vote. The result
+        always equals ``predict`` up to exact ties.
+        """
+        X = np.asarray(X, dtype=np.float32)
+        proba = np.zeros((X.shape[0], self.n_classes), dtype=np.float64)
+        trees_used = np.zeros(X.shape[0], dtype=np.int32)
+        active = np.arange(X.shape[0])
+
+        for start in range(0, self.n_trees, block_size):
+            roots = self.roots[start : start + block_size]
+            leaves = self.apply(X[active], roots)
+            proba[active] += self._node_values(leaves).sum(axis=0, dtype=np.float64)
+            trees_used[active] = start + len(roots)
+
+            remaining = self.n_trees - (start + len(roots))
+            if remaining == 0 or self.n_classes < 2:
+                break
+            top_two = np.partition(proba[active], -2, axis=1)[:, -2:]
+            active = active[top_two[:, 1] - top_two[:, 0] <= remaining]
+            if active.size == 0:
+                break
+
+        return self.classes.take(np.argmax(proba, axis=1)), trees_used
+
+    def _node_values(self, nodes: np.ndarray) -> np.ndarray:
+        """Class distribution stored at each node, shape ``nodes.shape + (n_classes,)``."""
+        if self.value_index is None:
+            return self.value[nodes]
+        return self.value[self.value_index[nodes]]
+
+
+def _smallest_uint(n_values: int) -> np.dtype:
+    """Smallest unsigned integer dtype able to index ``n_values`` items."""
+    return np.min_scalar_type(max(int(n_values) - 1, 0))
+
+
+def save_forest(forest: CompiledForest, path: str, source_sha256: str) -> None:
+    """Write a compiled forest to an uncompressed .npz with its source checksum."""
+    np.savez(path, source_sha256=np.array(source_sha256), **forest.to_arrays())
+
+
+def load_forest(path: str) -> tuple[CompiledForest, str]:
+    """Read a forest written by ``save_forest``; return (forest, source_sha256)."""
+    with np.load(path) as data:
+        arrays = {key: data[key] for key in data.files}
+    return CompiledForest.from_arrays(arrays), str(arrays["source_sha256"])
+
+
+def _round_down_float32(threshold: np.ndarray) -> np.ndarray:
+    """Largest float32 values not greater than the given float64 thresholds."""
+    rounded = threshold.astype(np.float32)
+    too_high = rounded.astype(np.float64) > threshold
+    rounded[too_high] = np.nextafter(rounded[too_high], np.float32(-np.inf))
+    return rounded
@@ -0,0 +1,100 @@
+"""
+Bounded in-memory memo for one stage of the feature pipeline.
+
+Each stage (description → PCA vector, environment → encoding, UNS → encoding,
+temperature → scaled value) keeps the values it has already computed, so a
+request that changes only some inputs recomputes only the affected stages.
+
+Float keys are canonicalised: they are rounded to ``_FLOAT_DECIMALS`` places and
+every NaN maps to one shared key, so NaN inputs cannot fill the memo with
+entries that never hit.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Sequence
+
+import numpy as np
+
+_FLOAT_DECIMALS = 9
+# One NaN object for every NaN key: dict lookups match it by identity
+_NAN_KEY = float("nan")
+
+
+class StageMemo:
+    """Thread-safe LRU memo mapping stage inputs to computed rows."""
+
+    def __init__(self, name: str, max_entries: int):
+        if max_entries <= 0:
+            raise ValueError("StageMemo max_entries must be positive.")
+        self.name = name
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(
+        self, keys: Sequence[Hashable], compute: Callable[[list], np.ndarray]
+    ) -> np.ndarray:
+        """Return ``compute(keys)`` row for row, computing only unseen keys.
+
+        ``compute`` receives the distinct missing keys, canonicalised, in one
+        call and must return one row (or scalar) per key. Hits and misses are
+        counted per distinct key.
+        """
+        positions: dict[Hashable, int] = {}
+        inverse = np.fromiter(
+            (positions.setdefault(_canonical(key), len(positions)) for key in keys),
+            dtype=np.intp,
+            count=len(keys),
+        )
+        unique_keys = list(positions)
+        if not unique_keys:
+            return np.asarray(compute([]))
+
+        with self._lock:
+            values = [self._entries.get(key) for key in unique_keys]
+            for key, value in zip(unique_keys, values):
+                if value is not None:
+                    self._entries.move_to_end(key)
+        missing = [i for i, value in enumerate(values) if value is None]
+
+        if missing:
+            computed = np.asarray(compute([unique_keys[i] for i in missing]))
+            for i, row in zip(missing, computed):
+                values[i] = row
+        with self._lock:
+            self.hits += len(unique_keys) - len(missing)
+            self.misses += len(missing)
+            for i in missing:
+                self._entries[unique_keys[i]] = values[i]
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return np.asarray(values)[inverse]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "stage": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "entries": len(self._entries),
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+def _canonical(key: Hashable) -> Hashable:
+    """Round float keys and collapse every NaN onto one shared key."""
+    if isinstance(key, (float, np.floating)):
+        return _NAN_KEY if np.isnan(key) else round(float(key), _FLOAT_DECIMALS)
+    return key
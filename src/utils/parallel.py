@@ -0,0 +1,226 @@
+"""
+Multi-process batch scoring over shared memory.
+
+Raw input columns are packed once into ``multiprocessing.shared_memory`` blocks:
+numeric columns as float64 arrays, text columns as concatenated UTF-8 bytes
+plus int64 offsets. Worker processes attach to those blocks and score
+contiguous row ranges with their own ``CorrosionClassifier``, through the same
+``predict_features`` path as ``predict_batch``; only the ranges and the
+resulting labels cross the process boundary, never a DataFrame.
+
+CPU cores are split evenly between workers: each worker limits torch, OpenMP
+and BLAS to its share of threads when it starts, so SciBERT or a matrix
+product inside one worker does not compete with the others. ``ParallelScorer``
+keeps the pool (and each worker's loaded models) alive across batches;
+``score_parallel`` is a one-shot convenience wrapper.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+
+from config.config import COMMENT_COLUMN, PARALLEL_CHUNK_ROWS
+
+logger = logging.getLogger(__name__)
+
+_TEXT_COLUMNS = ("Environment", "UNS", COMMENT_COLUMN)
+_NUMERIC_COLUMNS = ("Temperature (deg C)", "Concentration_clean")
+# Read by OpenMP and the BLAS libraries loaded after a worker starts
+_THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+# (shared memory name, dtype string, shape) — cheap to send to a worker
+ArraySpec = tuple[str, str, tuple[int, ...]]
+
+# Per-worker state, set by _init_worker
+_worker_classifier = None
+
+
+class ParallelScorer:
+    """A pool of scoring worker processes, reused for every batch it scores."""
+
+    def __init__(
+        self, n_workers: int | None = None, chunk_rows: int = PARALLEL_CHUNK_ROWS
+    ):
+        self.n_workers = max(1, n_workers or os.cpu_count() or 1)
+        self.chunk_rows = chunk_rows
+        self.threads_per_worker = max(1, (os.cpu_count() or 1) // self.n_workers)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.threads_per_worker,),
+        )
+
+    def __enter__(self) -> "ParallelScorer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._pool.shutdown()
+
+    def score(self, df: pd.DataFrame) -> pd.Series:
+        """Score a frame of raw inputs across the pool; labels aligned to ``df.index``."""
+        from utils.predictor import validate_batch
+
+        validate_batch(df)
+        if df.empty:
+            return pd.Series(index=df.index, dtype=object)
+
+        n_rows = len(df)
+        # Give every worker a share even when the frame is smaller than a chunk
+        chunk_rows = max(1, min(self.chunk_rows, -(-n_rows // self.n_workers)))
+        blocks: dict[str, SharedMemory] = {}
+        try:
+            specs = {}
+            for column in _NUMERIC_COLUMNS:
+                values = df[column].to_numpy(dtype=np.float64)
+                specs[column] = _share(values, blocks)
+            for column in _TEXT_COLUMNS:
+                data, offsets = _pack_strings(df[column])
+                specs[column] = (_share(data, blocks), _share(offsets, blocks))
+
+            ranges = [
+                (start, min(start + chunk_rows, n_rows))
+                for start in range(0, n_rows, chunk_rows)
+            ]
+            logger.info(
+                "Scoring %d rows in %d chunks on %d workers (%d threads each)",
+                n_rows,
+                len(ranges),
+                self.n_workers,
+                self.threads_per_worker,
+            )
+            futures = [
+                self._pool.submit(_score_range, specs, start, end)
+                for start, end in ranges
+            ]
+            wait(futures)  # no worker may still be using the blocks below
+            labels = [label for future in futures for label in future.result()]
+        finally:
+            for block in blocks.values():
+                block.close()
+                block.unlink()
+
+        return pd.Series(labels, index=df.index, dtype=object)
+
+
+def score_parallel(
+    df: pd.DataFrame,
+    n_workers: int | None = None,
+    chunk_rows: int = PARALLEL_CHUNK_ROWS,
+) -> pd.Series:
+    """Score one frame on a temporary pool; labels aligned to ``df.index``."""
+    n_chunks = max(1, -(-len(df) // chunk_rows))
+    n_workers = min(n_workers or os.cpu_count() or 1, n_chunks)
+    with ParallelScorer(n_workers, chunk_rows) as scorer:
+        return scorer.score(df)
+
+
+# ---- Shared Memory ----
+
+
+def _share(array: np.ndarray, blocks: dict[str, SharedMemory]) -> ArraySpec:
+    """Copy ``array`` into a new shared memory block, kept in ``blocks`` by name."""
+    block = SharedMemory(create=True, size=max(array.nbytes, 1))
+    blocks[block.name] = block
+    _attach((block.name, array.dtype.str, array.shape), block)[...] = array
+    return block.name, array.dtype.str, array.shape
+
+
+def _attach(spec: ArraySpec, block: SharedMemory) -> np.ndarray:
+    _, dtype, shape = spec
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+
+def _pack_strings(values: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Encode strings as concatenated UTF-8 bytes plus row offsets."""
+    encoded = [("" if pd.isna(v) else str(v)).encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _unpack_strings(
+    data: np.ndarray, offsets: np.ndarray, start: int, end: int
+) -> list[str]:
+    raw = data[offsets[start] : offsets[end]].tobytes()
+    base = offsets[start]
+    return [
+        raw[offsets[i] - base : offsets[i + 1] - base].decode("utf-8")
+        for i in range(start, end)
+    ]
+
+
+# ---- Worker ----
+
+
+def _init_worker(n_threads: int) -> None:
+    """Give this worker its share of cores and its own classifier.
+
+    Runs in the worker process, so the parent's environment is never touched.
+    numpy is already imported by now; its BLAS pool is capped through
+    threadpoolctl (a scikit-learn dependency), and the environment covers
+    OpenMP runtimes loaded later with torch.
+    """
+    global _worker_classifier
+    os.environ.update({name: str(n_threads) for name in _THREAD_ENV_VARS})
+    from threadpoolctl import threadpool_limits
+
+    threadpool_limits(limits=n_threads)
+    import torch
+
+    torch.set_num_threads(n_threads)
+    torch.set_num_interop_threads(1)
+    from utils.predictor import CorrosionClassifier
+
+    _worker_classifier = CorrosionClassifier()
+
+
+def _score_range(specs: dict, start: int, end: int) -> list[str]:
+    """Score rows [start, end) of the shared inputs; return their labels."""
+    opened: list[SharedMemory] = []
+
+    def read(spec: ArraySpec, first: int, last: int) -> np.ndarray:
+        """Copy elements [first, last) out of a shared block, keeping no view."""
+        block = SharedMemory(name=spec[0])
+        opened.append(block)
+        return _attach(spec, block)[first:last].copy()
+
+    def read_text(data_spec: ArraySpec, offsets_spec: ArraySpec) -> list[str]:
+        offsets = read(offsets_spec, start, end + 1)
+        data = read(data_spec, offsets[0], offsets[-1])
+        return _unpack_strings(data, offsets - offsets[0], 0, end - start)
+
+    try:
+        numeric = {
+            column: read(specs[column], start, end) for column in _NUMERIC_COLUMNS
+        }
+        text = {column: read_text(*specs[column]) for column in _TEXT_COLUMNS}
+    finally:
+        for block in opened:
+            try:
+                block.close()
+            except BufferError:
+                logger.warning("Shared block %s still in use on close", block.name)
+
+    features = _worker_classifier.encode_features(
+        text["Environment"],
+        text["UNS"],
+        numeric["Temperature (deg C)"],
+        numeric["Concentration_clean"],
+        text[COMMENT_COLUMN],
+    )
+    return _worker_classifier.predict_features(features)
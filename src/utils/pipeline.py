@@ -0,0 +1,251 @@
+"""
+Streaming, staged batch executor.
+
+Each chunk of raw input rows passes through six stages, each running in its own
+thread and connected by bounded queues:
+
+    clean → tokenize → embed (SciBERT) → project (PCA) → encode → classify
+
+Every stage calls the public staged methods of ``CorrosionClassifier``, so
+chunks go through the same caches and transforms as ``predict_batch``. While
+SciBERT embeds one chunk, the next is being tokenized and the previous one
+classified. Tokenizers, torch and NumPy release the GIL for their heavy work,
+so the stages genuinely overlap. Bounded queues cap the number of chunks in
+flight, and so the memory used. Per-stage throughput and queue depth are
+available from ``PipelineExecutor.stats()`` while a run is in progress.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from config.config import COMMENT_COLUMN, PIPELINE_CHUNK_ROWS, PIPELINE_QUEUE_SIZE
+from utils.predictor import CorrosionClassifier, PendingProjection, validate_batch
+from utils.processors import clean_condition_text
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("clean", "tokenize", "embed", "project", "encode", "classify")
+
+# Seconds between checks for cancellation while blocked on a queue
+_POLL_SECONDS = 0.1
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    """Work done by one pipeline stage."""
+
+    name: str
+    chunks: int = 0
+    rows: int = 0
+    busy_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.busy_seconds if self.busy_seconds else 0.0
+
+
+@dataclass
+class _Chunk:
+    """A chunk of input rows and the intermediate results of each stage."""
+
+    frame: pd.DataFrame
+    text: PendingProjection | None = None
+    pca: np.ndarray | None = None
+    features: np.ndarray | None = None
+    labels: pd.Series | None = None
+
+
+@dataclass
+class _Failure:
+    error: BaseException
+
+
+class PipelineExecutor:
+    """Score chunks of raw inputs with every pipeline stage running concurrently."""
+
+    def __init__(
+        self,
+        classifier: CorrosionClassifier | None = None,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+    ):
+        self.classifier = classifier or CorrosionClassifier()
+        self.queue_size = queue_size
+        self._stats = {name: StageStats(name) for name in STAGES}
+        self._queues: list[queue.Queue] = []
+
+    def stats(self) -> list[dict]:
+        """Per-stage counters plus the current depth of each stage's input queue."""
+        rows = []
+        for i, name in enumerate(STAGES):
+            stage = self._stats[name]
+            rows.append(
+                {
+                    "stage": name,
+                    "chunks": stage.chunks,
+                    "rows": stage.rows,
+                    "busy_seconds": round(stage.busy_seconds, 3),
+                    "rows_per_second": round(stage.rows_per_second, 1),
+                    "queue_depth": self._queues[i].qsize() if self._queues else 0,
+                    "queue_capacity": self.queue_size,
+                }
+            )
+        return rows
+
+    def predict_batch(
+        self, df: pd.DataFrame, chunk_rows: int = PIPELINE_CHUNK_ROWS
+    ) -> pd.Series:
+        """Score a whole frame in chunks; labels aligned to ``df.index``."""
+        chunks = (df.iloc[i : i + chunk_rows] for i in range(0, len(df), chunk_rows))
+        labels = list(self.run(chunks))
+        if not labels:
+            return pd.Series(index=df.index, dtype=object)
+        return pd.concat(labels)
+
+    def run(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.Series]:
+        """Yield labels for each input chunk, in input order.
+
+        Raises the first error from any stage. Stopping iteration early shuts
+        the stage threads down.
+        """
+        self.classifier.load()  # once here rather than racing in the stages
+        handlers: list[Callable[[_Chunk], None]] = [
+            self._clean,
+            self._tokenize,
+            self._embed,
+            self._project,
+            self._encode,
+            self._classify,
+        ]
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(STAGES) + 1)]
+        self._queues = queues
+        stop = threading.Event()
+
+        threads = [
+            threading.Thread(
+                target=self._feed, args=(chunks, queues[0], stop), daemon=True
+            )
+        ]
+        for i, (name, handler) in enumerate(zip(STAGES, handlers)):
+            threads.append(
+                threading.Thread(
+                    target=self._run_stage,
+                    args=(name, handler, queues[i], queues[i + 1], stop),
+                    name=f"pipeline-{name}",
+                    daemon=True,
+                )
+            )
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = queues[-1].get()
+                if item is _DONE:
+                    break
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item.labels
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            logger.info("Pipeline stats: %s", self.stats())
+
+    # ---- Threads ----
+
+    @staticmethod
+    def _feed(chunks: Iterable[pd.DataFrame], outbox: queue.Queue, stop) -> None:
+        try:
+            for frame in chunks:
+                validate_batch(frame)
+                if not _put(outbox, _Chunk(frame), stop):
+                    return
+        except Exception as e:
+            _put(outbox, _Failure(e), stop)
+            return
+        _put(outbox, _DONE, stop)
+
+    def _run_stage(self, name, handler, inbox, outbox, stop) -> None:
+        stats = self._stats[name]
+        while True:
+            item = _get(inbox, stop)
+            if item is None:
+                return
+            if isinstance(item, _Chunk):
+                start = time.perf_counter()
+                try:
+                    handler(item)
+                except Exception as e:
+                    logger.error("Pipeline stage '%s' failed: %s", name, e)
+                    item = _Failure(e)
+                else:
+                    stats.chunks += 1
+                    stats.rows += len(item.frame)
+                    stats.busy_seconds += time.perf_counter() - start
+            if not _put(outbox, item, stop) or item is _DONE:
+                return
+
+    # ---- Stages ----
+
+    def _clean(self, chunk: _Chunk) -> None:
+        cleaned = [clean_condition_text(str(c)) for c in chunk.frame[COMMENT_COLUMN]]
+        chunk.text = self.classifier.lookup_projections(cleaned)
+
+    def _tokenize(self, chunk: _Chunk) -> None:
+        self.classifier.tokenize_missing(chunk.text)
+
+    def _embed(self, chunk: _Chunk) -> None:
+        self.classifier.embed_missing(chunk.text)
+
+    def _project(self, chunk: _Chunk) -> None:
+        chunk.pca = self.classifier.project_missing(chunk.text)
+        chunk.text = None
+
+    def _encode(self, chunk: _Chunk) -> None:
+        frame = chunk.frame
+        # Copy out of the reusable buffer: this thread refills it for the next chunk
+        chunk.features = self.classifier.assemble_features(
+            frame["Environment"],
+            frame["UNS"],
+            frame["Temperature (deg C)"],
+            frame["Concentration_clean"],
+            chunk.pca,
+        ).copy()
+        chunk.pca = None
+
+    def _classify(self, chunk: _Chunk) -> None:
+        chunk.labels = pd.Series(
+            self.classifier.predict_features(chunk.features),
+            index=chunk.frame.index,
+            dtype=object,
+        )
+        chunk.features = None
+
+
+def _put(outbox: queue.Queue, item, stop: threading.Event) -> bool:
+    """Put ``item`` unless the run is stopped first; return whether it was put."""
+    while not stop.is_set():
+        try:
+            outbox.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(inbox: queue.Queue, stop: threading.Event):
+    """Get the next item, or None once the run is stopped."""
+    while not stop.is_set():
+        try:
+            return inbox.get(timeout=_POLL_SECONDS)
+        except queue.Empty:
+            continue
+    return None
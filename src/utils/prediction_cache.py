@@ -0,0 +1,126 @@
+"""
+Bounded, thread-safe cache of final prediction results.
+
+Entries are keyed by the full normalised input and evicted least-recently-used
+past a size cap or once older than a TTL. The cache is tagged with the version
+of the models that produced its entries (a hash of their source checksums); the
+first lookup under a different version empties it.
+
+Statistics can be written in the Prometheus text exposition format, suitable
+for node_exporter's textfile collector.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+_METRIC_PREFIX = "corrosion_prediction_cache"
+
+
+class PredictionCache:
+    """LRU + TTL cache of prediction results for one model version."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        version: str | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries <= 0:
+            raise ValueError("PredictionCache max_entries must be positive.")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.version = version
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(
+            ("hits", "misses", "evictions", "expirations", "invalidations"), 0
+        )
+        self._last_metrics_write = float("-inf")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ensure_version(self, version: str) -> None:
+        """Drop every entry if the model version has changed.
+
+        A cache created without a version adopts the first one it sees.
+        """
+        with self._lock:
+            if version == self.version:
+                return
+            if self.version is not None:
+                self._entries.clear()
+                self._counters["invalidations"] += 1
+            self.version = version
+
+    def get(self, key: Hashable):
+        """Return the cached value, or None on a miss or an expired entry."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                self._counters["expirations"] += 1
+                entry = None
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._counters)
+            stats["size"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["max_entries"] = self.max_entries
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["version"] = self.version or ""
+        return stats
+
+    # ---- Metrics Export ----
+
+    def write_metrics(self, path: str) -> None:
+        """Atomically write the statistics as Prometheus text-format metrics."""
+        stats = self.stats()
+        label = f'{{version="{stats["version"]}"}}'
+        lines = []
+        for name in ("hits", "misses", "evictions", "expirations", "invalidations"):
+            lines.append(f"# TYPE {_METRIC_PREFIX}_{name}_total counter")
+            lines.append(f"{_METRIC_PREFIX}_{name}_total{label} {stats[name]}")
+        for name in ("size", "max_entries", "hit_rate"):
+            lines.append(f"# TYPE {_METRIC_PREFIX}_{name} gauge")
+            lines.append(f"{_METRIC_PREFIX}_{name}{label} {stats[name]}")
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+
+    def maybe_write_metrics(self, path: str, interval_seconds: float) -> None:
+        """Write metrics if at least ``interval_seconds`` passed since the last write."""
+        now = self._clock()
+        with self._lock:
+            if now - self._last_metrics_write < interval_seconds:
+                return
+            self._last_metrics_write = now
+        self.write_metrics(path)
@@ -1,101 +1,589 @@
 """
 Corrosion rate prediction pipeline using scikit-learn models and SciBERT embeddings.
+
+Models are loaded on first use rather than at construction, and joblib (and with
+it scikit-learn / category_encoders via unpickling) is imported only then.
 """
 
+import hashlib
+import json
 import logging
+import math
+import os
+import threading
+from dataclasses import dataclass
+from typing import Sequence
 
-import joblib
 import numpy as np
 import pandas as pd
 import streamlit as st
 
-from config.config import MODEL_PATHS, NOT_COMPOSE_COLUMNS
-from utils.processors import clean_condition_text, get_cached_scibert_embedding
-from utils.vars import targets
+from config.config import (
+    ARTIFACT_MANIFEST_PATH,
+    BATCH_INPUT_COLUMNS,
+    COMMENT_COLUMN,
+    FOREST_EARLY_EXIT,
+    INFERENCE_BUNDLE_PATH,
+    MODEL_PATHS,
+    NOT_COMPOSE_COLUMNS,
+    PCA_CACHE_DIR,
+    PCA_CACHE_MAX_ENTRIES,
+    PREDICTION_CACHE_MAX_ENTRIES,
+    PREDICTION_CACHE_METRICS_INTERVAL,
+    PREDICTION_CACHE_METRICS_PATH,
+    PREDICTION_CACHE_TTL_SECONDS,
+    SCIBERT_BACKEND,
+    STAGE_MEMO_MAX_ENTRIES,
+)
+from utils.artifacts import (
+    LoadReport,
+    artifact_digest,
+    load_artifacts,
+    read_manifest,
+    source_digests,
+)
+from utils.bundle import open_bundle
+from utils.compiled import compile_pipeline
+from utils.embedding_store import EmbeddingStore
+from utils.memo import StageMemo
+from utils.prediction_cache import PredictionCache
+from utils.processors import (
+    clean_condition_text,
+    embed_token_batches,
+    lookup_embeddings,
+    store_embeddings,
+    tokenize_for_embedding,
+)
+from utils.singleflight import SingleFlight
+from utils.vars import targets, uns_nums
 
 logger = logging.getLogger(__name__)
 
 # Number of PCA components expected by the trained model
 _N_PCA_COMPONENTS = 15
+_PCA_COLUMNS = [f"PCA_{i+1}" for i in range(_N_PCA_COMPONENTS)]
+_FEATURE_COLUMNS = NOT_COMPOSE_COLUMNS + _PCA_COLUMNS
+_COLUMN_INDEX = {name: i for i, name in enumerate(_FEATURE_COLUMNS)}
+
+
+@dataclass
+class PendingProjection:
+    """Distinct cleaned descriptions on their way to PCA features.
+
+    Built by ``CorrosionClassifier.lookup_projections`` and completed by
+    ``tokenize_missing``, ``embed_missing`` and ``project_missing``.
+    """
+
+    texts: list[str]
+    inverse: np.ndarray  # row → position in ``texts``
+    pca: np.ndarray
+    pca_missing: np.ndarray  # positions in ``texts`` without a cached projection
+    embeddings: np.ndarray  # one row per ``pca_missing`` entry
+    embed_missing: np.ndarray  # positions in ``pca_missing`` without an embedding
+    batches: list | None = None
+
+    def texts_to_embed(self) -> list[str]:
+        return [self.texts[self.pca_missing[i]] for i in self.embed_missing]
 
 
 class CorrosionClassifier:
     """Loads pre-trained ML models and provides corrosion-rate predictions."""
 
     def __init__(self):
-        self.models = self._load_models()
+        self._models: dict | None = None
+        self._compiled: dict | None = None
+        self._model_version: str | None = None
+        # Feature buffers are per thread: warm-up, sessions and pipeline stages
+        # may share one classifier
+        self._local = threading.local()
+
+    @property
+    def models(self) -> dict:
+        """Fitted artifacts keyed by MODEL_PATHS name, loaded on first access."""
+        if self._models is None:
+            self._models = self._load_models()
+        return self._models
+
+    @property
+    def compiled(self) -> dict:
+        """Array-backed transforms derived from ``models``, built on first access."""
+        if self._compiled is None:
+            self._compiled, self._model_version = self._load_compiled()
+        return self._compiled
+
+    @property
+    def model_version(self) -> str:
+        """Short hash of the source checksums of the models actually loaded."""
+        if self._model_version is None:
+            self._compiled, self._model_version = self._load_compiled()
+        return self._model_version
+
+    def load(self) -> dict:
+        """Load the compiled transforms now rather than on first use; return them."""
+        return self.compiled
 
     @staticmethod
     @st.cache_resource
     def _load_models() -> dict:
         """Load all serialized models into memory (cached across Streamlit reruns)."""
-        loaded = {}
-        for name, path in MODEL_PATHS.items():
-            try:
-                loaded[name] = joblib.load(path)
-                logger.info("Loaded model '%s' from %s", name, path)
-            except FileNotFoundError:
-                logger.error("Model file not found: %s", path)
-                raise
-            except Exception as e:
-                logger.error("Failed to load model '%s': %s", name, e)
-                raise
-        return loaded
+        return _read_artifacts()[0]
+
+    @staticmethod
+    @st.cache_resource
+    def _load_compiled() -> tuple[dict, str]:
+        """Array-backed versions of the fitted transforms (cached across reruns).
+
+        Memory-maps the inference bundle when one is present and matches the
+        artifact manifest; otherwise compiles everything from the pickles,
+        which are then released rather than cached alongside their compiled
+        copies. Returns ``(compiled, model_version)``, the version hashing the
+        source checksums of whichever was loaded.
+        """
+        if os.path.exists(INFERENCE_BUNDLE_PATH):
+            compiled, metadata = open_bundle(INFERENCE_BUNDLE_PATH)
+            stale = _stale_bundle_sources(metadata)
+            if not stale:
+                # A re-export (e.g. a differently pruned forest) is a new version
+                sources = {**metadata["sources"], "bundle": metadata.get("created")}
+                return compiled, _version_of(sources)
+            logger.warning(
+                "Inference bundle is stale (%s changed or unverified); "
+                "loading pickled artifacts",
+                ", ".join(stale),
+            )
+        models, reports = _read_artifacts()
+        compiled = compile_pipeline(models)
+        return compiled, _version_of({r.name: r.sha256 for r in reports})
 
     def preprocess_input(
         self, env: str, temp: float, conc: float, uns_input: str, comment: str
     ) -> pd.DataFrame:
         """Transform raw user inputs into model-ready feature DataFrame."""
-        # Build input DataFrame
-        input_df = pd.DataFrame(
-            [
-                {
-                    "Environment": env,
-                    "Temperature (deg C)": temp,
-                    "Concentration_clean": conc,
-                    "UNS": uns_input,
-                }
-            ]
+        features = self.encode_features([env], [uns_input], [temp], [conc], [comment])
+        return pd.DataFrame(features, columns=_FEATURE_COLUMNS, copy=True)
+
+    def preprocess_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Transform a frame of raw inputs into model-ready features, one pass per stage."""
+        validate_batch(df)
+        features = self.encode_features(
+            df["Environment"],
+            df["UNS"],
+            df["Temperature (deg C)"],
+            df["Concentration_clean"],
+            df[COMMENT_COLUMN],
+        )
+        return pd.DataFrame(
+            features, columns=_FEATURE_COLUMNS, index=df.index, copy=True
         )
 
-        # Encode categorical variables
-        input_df["Environment"] = self.models["env_encoder"].transform(
-            input_df["Environment"]
+    def encode_features(self, env, uns, temp, conc, comments) -> np.ndarray:
+        """Assemble model-ready features directly into a NumPy array in model column order.
+
+        The returned array is a view of a buffer reused by the next call from the
+        same thread; copy it if it must outlive that call.
+        """
+        if len(comments) == 0:
+            return self._feature_buffer(0)
+        return self.assemble_features(
+            env, uns, temp, conc, self.pca_features(comments)
         )
-        input_df["UNS"] = self.models["uns_encoder"].transform(input_df["UNS"])
 
-        # Scale temperature
-        input_df["Temperature (deg C)"] = self.models["temp_scaler"].transform(
-            input_df[["Temperature (deg C)"]]
+    def assemble_features(self, env, uns, temp, conc, pca_features) -> np.ndarray:
+        """Encode tabular inputs and combine them with precomputed PCA features.
+
+        Writes into the same reusable buffer as ``encode_features``. Temperature
+        goes through its memo only for single rows; batches are scaled in one
+        vectorised pass.
+        """
+        features = self._feature_buffer(len(pca_features))
+        memos = _stage_memos()
+
+        features[:, _COLUMN_INDEX["Environment"]] = memos["env"].lookup(
+            env, self.compiled["env_encoder"]
+        )
+        features[:, _COLUMN_INDEX["UNS"]] = memos["uns"].lookup(
+            uns, self.compiled["uns_encoder"]
         )
+        if len(features) == 1:
+            scaled_temp = memos["temp"].lookup(temp, self.compiled["temp_scaler"])
+        else:
+            scaled_temp = self.compiled["temp_scaler"](temp)
+        features[:, _COLUMN_INDEX["Temperature (deg C)"]] = scaled_temp
+        features[:, _COLUMN_INDEX["Concentration_clean"]] = np.asarray(
+            conc, dtype=np.float64
+        )
+        features[:, _COLUMN_INDEX["PCA_1"] :] = pca_features
+        return features
+
+    def _feature_buffer(self, n_rows: int) -> np.ndarray:
+        """Return an (n_rows, n_features) view of the calling thread's reusable buffer."""
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None or buffer.shape[0] < n_rows:
+            buffer = self._local.buffer = np.empty(
+                (max(n_rows, 1), len(_FEATURE_COLUMNS)), dtype=np.float64
+            )
+        return buffer[:n_rows]
 
-        # Process condition text using SciBERT
-        cleaned_comment = clean_condition_text(comment)
-        scibert_embedding = np.squeeze(get_cached_scibert_embedding(cleaned_comment))
-        scibert_df = pd.DataFrame(
-            [scibert_embedding],
-            columns=[f"scibert_{i}" for i in range(len(scibert_embedding))],
+    def pca_features(self, comments) -> np.ndarray:
+        """PCA features per description, through the stage memo and projection caches.
+
+        This is the text half of ``encode_features``; combine its output with
+        the tabular inputs using ``assemble_features``.
+        """
+        # Keyed like the prediction cache, so equivalent descriptions share a row
+        return _stage_memos()["text"].lookup(
+            [clean_condition_text(str(comment)) for comment in comments],
+            self._project_texts,
         )
 
-        # PCA transformation
-        pca_emb = self.models["pca"].transform(scibert_df)
-        pca_df = pd.DataFrame(
-            pca_emb, columns=[f"PCA_{i+1}" for i in range(_N_PCA_COMPONENTS)]
+    def _project_texts(self, cleaned: list[str]) -> np.ndarray:
+        """Run the staged text methods back to back for cleaned descriptions."""
+        pending = self.lookup_projections(cleaned)
+        self.tokenize_missing(pending)
+        self.embed_missing(pending)
+        return self.project_missing(pending)
+
+    # ---- Staged Text Features ----
+    # lookup_projections → tokenize_missing → embed_missing → project_missing.
+    # Each step only touches its own stage's model or cache, so a pipeline can
+    # run them in separate threads on consecutive chunks.
+
+    @staticmethod
+    def lookup_projections(cleaned: Sequence[str]) -> PendingProjection:
+        """Deduplicate cleaned descriptions and look up cached projections.
+
+        Descriptions without a cached projection are then looked up in the
+        embedding store; only those still missing need SciBERT.
+        """
+        unique_texts, inverse = np.unique(list(cleaned), return_inverse=True)
+        texts = [str(text) for text in unique_texts]
+        pca, found = _open_pca_store().get_many(texts)
+        pca_missing = np.flatnonzero(~found)
+        embeddings, found = lookup_embeddings([texts[i] for i in pca_missing])
+        return PendingProjection(
+            texts=texts,
+            inverse=inverse.ravel(),
+            pca=pca,
+            pca_missing=pca_missing,
+            embeddings=embeddings,
+            embed_missing=np.flatnonzero(~found),
         )
 
-        # Assemble final feature vector in expected column order
-        full_input = pd.concat([input_df.reset_index(drop=True), pca_df], axis=1)
-        ordered_columns = NOT_COMPOSE_COLUMNS + [
-            f"PCA_{i+1}" for i in range(_N_PCA_COMPONENTS)
-        ]
-        return full_input[ordered_columns]
+    @staticmethod
+    def tokenize_missing(pending: PendingProjection) -> None:
+        """Tokenize the descriptions that still need SciBERT."""
+        texts = pending.texts_to_embed()
+        pending.batches = tokenize_for_embedding(texts) if texts else []
+
+    @staticmethod
+    def embed_missing(pending: PendingProjection) -> None:
+        """Run the tokenized descriptions through SciBERT and store the embeddings."""
+        if not pending.batches:
+            return
+        texts = pending.texts_to_embed()
+        vectors = embed_token_batches(pending.batches, len(texts))
+        pending.embeddings[pending.embed_missing] = vectors
+        pending.batches = None
+        store_embeddings(texts, vectors)
+
+    def project_missing(self, pending: PendingProjection) -> np.ndarray:
+        """Project and store the uncached descriptions; return PCA features per row."""
+        if pending.pca_missing.size:
+            projected = self.compiled["pca"](pending.embeddings)
+            pending.pca[pending.pca_missing] = projected
+            _open_pca_store().put_many(
+                [pending.texts[i] for i in pending.pca_missing], projected
+            )
+        return pending.pca[pending.inverse]
 
     def predict(
         self, env: str, temp: float, conc: float, uns_input: str, comment: str
     ) -> tuple[str, pd.DataFrame]:
         """Run the full prediction pipeline and return (class_label, features_df)."""
-        full_input = self.preprocess_input(env, temp, conc, uns_input, comment)
-        prediction = self.models["model"].predict(full_input)
-        predicted_class = targets.get(str(int(prediction[0])), "Unknown")
-        logger.info("Prediction result: %s (raw=%s)", predicted_class, prediction[0])
-        return predicted_class, full_input
+        predicted_class, features = self._predict_one(
+            env, temp, conc, uns_input, comment
+        )
+        return predicted_class, pd.DataFrame(
+            features[np.newaxis], columns=_FEATURE_COLUMNS, copy=True
+        )
+
+    def predict_label(
+        self, env: str, temp: float, conc: float, uns_input: str, comment: str
+    ) -> str:
+        """Predict the class label only, on the numeric path without any DataFrames."""
+        return self._predict_one(env, temp, conc, uns_input, comment)[0]
+
+    def _predict_one(
+        self, env: str, temp: float, conc: float, uns_input: str, comment: str
+    ) -> tuple[str, np.ndarray]:
+        """Predict one input through the result cache; return (label, feature row).
+
+        Raises ``ValueError`` for a non-finite temperature or concentration.
+        """
+        if not (math.isfinite(temp) and math.isfinite(conc)):
+            raise ValueError("Temperature and concentration must be finite numbers")
+        cache = _prediction_cache()
+        # Models load once per process; this empties the cache if they are
+        # reloaded (e.g. after clearing Streamlit's resource cache)
+        cache.ensure_version(self.model_version)
+        key = (
+            env,
+            uns_input,
+            float(temp),
+            float(conc),
+            clean_condition_text(str(comment)),
+        )
+        result = cache.get(key)
+        if result is None:
+            # Concurrent sessions submitting the same input share one computation
+            result = _inflight_predictions().do(
+                key, self._compute_one, key, env, temp, conc, uns_input, comment
+            )
+        else:
+            logger.info("Prediction result: %s (cached)", result[0])
+        cache.maybe_write_metrics(
+            PREDICTION_CACHE_METRICS_PATH, PREDICTION_CACHE_METRICS_INTERVAL
+        )
+        return result
+
+    def predict_batch(self, df: pd.DataFrame) -> tuple[pd.Series, pd.DataFrame]:
+        """Score a frame of raw inputs and return (labels, features_df) aligned to ``df.index``."""
+        full_input = self.preprocess_batch(df)
+        if full_input.empty:
+            return pd.Series(index=df.index, dtype=object), full_input
+
+        predictions, _ = self._forest_predict(full_input.to_numpy())
+        labels = pd.Series(
+            [to_label(raw) for raw in predictions], index=df.index, dtype=object
+        )
+        logger.info("Scored batch of %d rows", len(labels))
+        return labels, full_input
+
+    def rank_alloys(
+        self, env: str, temp: float, conc: float, comment: str
+    ) -> pd.DataFrame:
+        """Score every alloy in ``uns_nums`` for one condition, most resistant first.
+
+        The description is embedded and projected once and broadcast across all
+        alloys, which are then classified in a single forest call. The table has
+        one probability column per corrosion-rate class and an expected class
+        index (0 = lowest rate) used for sorting.
+        """
+        n_alloys = len(uns_nums)
+        pca_features = np.broadcast_to(
+            self.pca_features([comment]), (n_alloys, _N_PCA_COMPONENTS)
+        )
+        features = self.assemble_features(
+            [env] * n_alloys,
+            uns_nums,
+            np.full(n_alloys, temp, dtype=np.float64),
+            np.full(n_alloys, conc, dtype=np.float64),
+            pca_features,
+        )
+        forest = self.compiled["model"]
+        proba = forest.predict_proba(features)
+
+        # sklearn sorts classes, so column order is lowest to highest rate
+        table = pd.DataFrame(
+            {
+                "UNS": uns_nums,
+                "Predicted Corrosion Rate": [
+                    to_label(raw) for raw in forest.classes.take(proba.argmax(axis=1))
+                ],
+                "Expected Rate Index": proba @ np.arange(forest.n_classes),
+            }
+        )
+        for i, raw in enumerate(forest.classes):
+            table[f"P({to_label(raw)})"] = proba[:, i]
+        table = table.sort_values(
+            ["Expected Rate Index", "UNS"], ignore_index=True, kind="stable"
+        )
+        logger.info("Ranked %d alloys for environment '%s'", n_alloys, env)
+        return table
+
+    def sweep_conditions(
+        self,
+        env: str,
+        uns_input: str,
+        comment: str,
+        temps: np.ndarray,
+        concs: np.ndarray,
+    ) -> pd.DataFrame:
+        """Classify every (temperature, concentration) pair on a grid.
+
+        The description is embedded and projected once and the whole grid is
+        classified in a single forest call. Returns one row per cell with the
+        predicted class index, its label and the winning class probability.
+        """
+        grid_temp, grid_conc = np.meshgrid(
+            np.asarray(temps, dtype=np.float64),
+            np.asarray(concs, dtype=np.float64),
+            indexing="ij",
+        )
+        n_cells = grid_temp.size
+        features = self.assemble_features(
+            [env] * n_cells,
+            [uns_input] * n_cells,
+            grid_temp.ravel(),
+            grid_conc.ravel(),
+            np.broadcast_to(
+                self.pca_features([comment]), (n_cells, _N_PCA_COMPONENTS)
+            ),
+        )
+        forest = self.compiled["model"]
+        proba = forest.predict_proba(features)
+        rate_index = proba.argmax(axis=1)
+        labels = np.array([to_label(raw) for raw in forest.classes], dtype=object)
+        logger.info("Swept %d temperature/concentration cells", n_cells)
+        return pd.DataFrame(
+            {
+                "Temperature (deg C)": grid_temp.ravel(),
+                "Concentration_clean": grid_conc.ravel(),
+                "Rate Index": rate_index,
+                "Predicted Corrosion Rate": labels.take(rate_index),
+                "Confidence": proba.max(axis=1),
+            }
+        )
+
+    def predict_features(self, features: np.ndarray) -> list[str]:
+        """Classify an already-assembled numeric feature matrix."""
+        predictions, _ = self._forest_predict(features)
+        return [to_label(raw) for raw in predictions]
+
+    def _compute_one(
+        self,
+        key: tuple,
+        env: str,
+        temp: float,
+        conc: float,
+        uns_input: str,
+        comment: str,
+    ) -> tuple[str, np.ndarray]:
+        """Compute one prediction and store it in the result cache under ``key``."""
+        features = self.encode_features([env], [uns_input], [temp], [conc], [comment])
+        prediction, trees_used = self._forest_predict(
+            features, early_exit=FOREST_EARLY_EXIT
+        )
+        result = (to_label(prediction[0]), features[0].copy())
+        _prediction_cache().put(key, result)
+        logger.info(
+            "Prediction result: %s (raw=%s, trees=%d)",
+            result[0],
+            prediction[0],
+            trees_used[0],
+        )
+        return result
+
+    @staticmethod
+    def stage_stats() -> list[dict]:
+        """Hit/miss counters of the per-stage memos shared by this process."""
+        return [memo.stats() for memo in _stage_memos().values()]
+
+    @staticmethod
+    def prediction_cache_stats() -> dict:
+        """Hit rate, size and eviction counts of the shared prediction cache."""
+        return _prediction_cache().stats()
+
+    @staticmethod
+    def inflight_stats() -> dict:
+        """Executions and coalesced duplicates of concurrent identical predictions."""
+        return _inflight_predictions().stats()
+
+    def _forest_predict(
+        self, features: np.ndarray, early_exit: bool = False
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Classify a numeric feature matrix; return (raw classes, trees used per row).
+
+        ``early_exit`` stops voting per row once the result is decided; the
+        default evaluates the exact full forest.
+        """
+        forest = self.compiled["model"]
+        if early_exit:
+            return forest.predict_early_exit(features)
+        return forest.predict(features), np.full(len(features), forest.n_trees)
+
+
+def _read_artifacts() -> tuple[dict, list[LoadReport]]:
+    """Check artifacts against the manifest and load them in parallel threads."""
+    try:
+        return load_artifacts(MODEL_PATHS, read_manifest(ARTIFACT_MANIFEST_PATH))
+    except FileNotFoundError as e:
+        logger.error("Model file not found: %s", e.filename)
+        raise
+    except Exception as e:
+        logger.error("Failed to load models: %s", e)
+        raise
+
+
+@st.cache_resource
+def _open_pca_store() -> EmbeddingStore:
+    """Open the PCA projection cache for the currently deployed pca.pkl."""
+    version = artifact_digest(MODEL_PATHS["pca"])[:16]
+    return EmbeddingStore(
+        os.path.join(PCA_CACHE_DIR, version),
+        dim=_N_PCA_COMPONENTS,
+        capacity=PCA_CACHE_MAX_ENTRIES,
+        namespace=f"pca:{version}:{SCIBERT_BACKEND}",
+    )
+
+
+@st.cache_resource
+def _stage_memos() -> dict[str, StageMemo]:
+    """Process-wide memos for each feature stage, shared by every session."""
+    return {
+        stage: StageMemo(stage, STAGE_MEMO_MAX_ENTRIES)
+        for stage in ("text", "env", "uns", "temp")
+    }
+
+
+@st.cache_resource
+def _prediction_cache() -> PredictionCache:
+    """Prediction result cache shared by every session in this process."""
+    return PredictionCache(PREDICTION_CACHE_MAX_ENTRIES, PREDICTION_CACHE_TTL_SECONDS)
+
+
+@st.cache_resource
+def _inflight_predictions() -> SingleFlight:
+    """Coalesces identical predictions running concurrently in this process."""
+    return SingleFlight("predict")
+
+
+def _stale_bundle_sources(metadata: dict) -> list[str]:
+    """Artifacts the bundle cannot be trusted for.
+
+    Each bundle source checksum is compared with the manifest's, or, for an
+    artifact the manifest does not list, with the deployed file's own digest.
+    An artifact with neither an entry nor a file cannot be checked and is
+    stale too.
+    """
+    entries = (read_manifest(ARTIFACT_MANIFEST_PATH) or {}).get("artifacts", {})
+    present = {
+        name: path
+        for name, path in MODEL_PATHS.items()
+        if name in entries or os.path.exists(path)
+    }
+    current = source_digests(present, {"artifacts": entries})
+    sources = metadata.get("sources", {})
+    return [
+        name
+        for name in MODEL_PATHS
+        if name not in current or current[name] != sources.get(name)
+    ]
+
+
+def _version_of(sources: dict) -> str:
+    """Short hash of a name → checksum mapping of the loaded model sources."""
+    payload = json.dumps(sources, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def validate_batch(df: pd.DataFrame) -> None:
+    """Raise if a batch input frame lacks any required column."""
+    missing = [col for col in BATCH_INPUT_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Batch input is missing columns: {missing}")
+
+
+def to_label(raw) -> str:
+    """Map a raw model output to its human-readable corrosion-rate class."""
+    return targets.get(str(int(raw)), "Unknown")
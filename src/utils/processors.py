@@ -1,28 +1,50 @@
 """
 Text processing and SciBERT embedding utilities.
+
+torch and transformers are imported inside the embedding functions so that
+pages which only need the text helpers start without loading them.
 """
 
 import re
 import logging
+from typing import Sequence
+
 import numpy as np
 import streamlit as st
-import torch
-from transformers import AutoTokenizer, AutoModel
+
+from config.config import (
+    EMBEDDING_CACHE_DIR,
+    EMBEDDING_CACHE_MAX_ENTRIES,
+    SCIBERT_BACKEND,
+    SCIBERT_MODEL_DIR,
+    SCIBERT_MODEL_NAME,
+    SCIBERT_OFFLINE,
+    SCIBERT_ONNX_PATH,
+)
+from utils.embedding_store import EmbeddingStore
 
 logger = logging.getLogger(__name__)
 
 # ---- SciBERT Model (lazy-loaded & cached) ----
 
-_SCIBERT_MODEL_NAME = "allenai/scibert_scivocab_uncased"
+_SCIBERT_MODEL_NAME = SCIBERT_MODEL_NAME
+_MAX_LENGTH = 128
+_EMBEDDING_BATCH_SIZE = 32
+_EMBEDDING_DIM = 768
 
 
 @st.cache_resource
-def _load_scibert():
+def _load_scibert(backend: str = SCIBERT_BACKEND):
     """Load SciBERT tokenizer and model once, cached across Streamlit reruns."""
-    logger.info("Loading SciBERT model: %s", _SCIBERT_MODEL_NAME)
-    tokenizer = AutoTokenizer.from_pretrained(_SCIBERT_MODEL_NAME)
-    model = AutoModel.from_pretrained(_SCIBERT_MODEL_NAME)
-    model.eval()  # Set to evaluation mode — disables dropout
+    from utils.scibert_backends import load_encoder, resolve_model_source
+
+    logger.info(
+        "Loading SciBERT model: %s (backend=%s)", _SCIBERT_MODEL_NAME, backend
+    )
+    source = resolve_model_source(
+        _SCIBERT_MODEL_NAME, SCIBERT_MODEL_DIR, SCIBERT_OFFLINE
+    )
+    tokenizer, model = load_encoder(backend, source, SCIBERT_ONNX_PATH)
     logger.info("SciBERT model loaded successfully.")
     return tokenizer, model
 
@@ -42,19 +64,125 @@ def clean_condition_text(text: str) -> str:
 # ---- SciBERT Embedding ----
 
 
+def _masked_mean_pool(last_hidden_state, attention_mask) -> np.ndarray:
+    """Average token embeddings, ignoring padding positions."""
+    mask = attention_mask.unsqueeze(-1).to(last_hidden_state.dtype)
+    summed = (last_hidden_state * mask).sum(dim=1)
+    counts = mask.sum(dim=1).clamp(min=1.0)
+    return (summed / counts).numpy()
+
+
 def get_scibert_embedding(text: str) -> np.ndarray:
     """Generate a SciBERT embedding for the given text."""
+    import torch
+
     tokenizer, model = _load_scibert()
-    inputs = tokenizer(text, return_tensors="pt", truncation=True, max_length=128)
+    inputs = tokenizer(
+        text, return_tensors="pt", truncation=True, max_length=_MAX_LENGTH
+    )
     with torch.no_grad():
         outputs = model(**inputs)
-    return outputs.last_hidden_state.mean(dim=1).detach().numpy()
+    return _masked_mean_pool(outputs.last_hidden_state, inputs["attention_mask"])
+
+
+def get_scibert_embeddings(
+    texts: list[str],
+    batch_size: int = _EMBEDDING_BATCH_SIZE,
+    backend: str | None = None,
+) -> np.ndarray:
+    """Generate SciBERT embeddings for many texts, one row per input text.
+
+    Texts are tokenized once, sorted by token length and run through the model
+    in length buckets of ``batch_size`` so each batch carries minimal padding.
+    ``backend`` overrides the configured ``SCIBERT_BACKEND``.
+    """
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+
+    batches = tokenize_for_embedding(texts, batch_size, backend)
+    embeddings = embed_token_batches(batches, len(texts), backend)
+    logger.info("Embedded %d texts (batch size %d)", len(texts), batch_size)
+    return embeddings
+
+
+def tokenize_for_embedding(
+    texts: Sequence[str],
+    batch_size: int = _EMBEDDING_BATCH_SIZE,
+    backend: str | None = None,
+) -> list[tuple[np.ndarray, dict]]:
+    """Tokenize texts into padded, length-sorted batches of (row positions, inputs)."""
+    tokenizer, _ = _load_scibert(backend or SCIBERT_BACKEND)
+    encoded = tokenizer(list(texts), truncation=True, max_length=_MAX_LENGTH)
+    order = np.argsort([len(ids) for ids in encoded["input_ids"]], kind="stable")
+
+    batches = []
+    for start in range(0, len(order), batch_size):
+        bucket = order[start : start + batch_size]
+        features = [{key: encoded[key][i] for key in encoded.keys()} for i in bucket]
+        batches.append((bucket, tokenizer.pad(features, return_tensors="pt")))
+    return batches
+
+
+def embed_token_batches(
+    batches: list[tuple[np.ndarray, dict]], n_texts: int, backend: str | None = None
+) -> np.ndarray:
+    """Run tokenized batches through SciBERT; return pooled rows in input order."""
+    import torch
+
+    _, model = _load_scibert(backend or SCIBERT_BACKEND)
+    embeddings = np.empty((n_texts, 0), dtype=np.float32)
+    for bucket, inputs in batches:
+        with torch.no_grad():
+            outputs = model(**inputs)
+        pooled = _masked_mean_pool(outputs.last_hidden_state, inputs["attention_mask"])
+        if embeddings.shape[1] == 0:
+            embeddings = np.empty((n_texts, pooled.shape[1]), dtype=np.float32)
+        embeddings[bucket] = pooled
+    return embeddings
+
+
+@st.cache_resource
+def _open_embedding_store() -> EmbeddingStore:
+    """Open the on-disk embedding store once per process."""
+    return EmbeddingStore(
+        EMBEDDING_CACHE_DIR,
+        dim=_EMBEDDING_DIM,
+        capacity=EMBEDDING_CACHE_MAX_ENTRIES,
+        namespace=f"{_SCIBERT_MODEL_NAME}:{SCIBERT_BACKEND}",
+    )
+
+
+def lookup_embeddings(texts: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Look texts up in the embedding store; return (embeddings, found mask)."""
+    return _open_embedding_store().get_many(texts)
+
+
+def store_embeddings(texts: Sequence[str], embeddings: np.ndarray) -> None:
+    """Add freshly computed embeddings to the embedding store."""
+    _open_embedding_store().put_many(texts, embeddings)
 
 
-@st.cache_data
 def get_cached_scibert_embedding(text: str) -> np.ndarray:
     """Cached wrapper for SciBERT embedding generation."""
-    return get_scibert_embedding(text)
+    return get_cached_scibert_embeddings([text])
+
+
+def get_cached_scibert_embeddings(texts: Sequence[str]) -> np.ndarray:
+    """Embed texts through the disk-backed store; only misses reach SciBERT.
+
+    Callers should pass ``clean_condition_text`` output so equivalent field
+    descriptions share one cache entry.
+    """
+    embeddings, found = lookup_embeddings(texts)
+    missing = np.flatnonzero(~found)
+    if missing.size:
+        missing_texts = [texts[i] for i in missing]
+        embeddings[missing] = get_scibert_embeddings(missing_texts)
+        store_embeddings(missing_texts, embeddings[missing])
+    logger.info(
+        "Embedding cache: %d hits, %d misses", len(texts) - missing.size, missing.size
+    )
+    return embeddings
 
 
 # ---- LLM Output Cleaning ----
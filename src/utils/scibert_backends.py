@@ -0,0 +1,117 @@
+"""
+Inference backends for the SciBERT encoder.
+
+Every backend returns a ``(tokenizer, model)`` pair where ``model(**inputs)``
+yields an object with a ``last_hidden_state`` tensor, so the pooling code in
+``utils.processors`` is backend-agnostic.
+
+- ``torch``:      eager PyTorch, fp32 (reference)
+- ``torch-int8``: PyTorch with dynamic int8 quantization of all Linear layers
+- ``onnx``:       exported ONNX graph run under ONNX Runtime on CPU
+"""
+
+import logging
+import os
+from types import SimpleNamespace
+
+import torch
+from transformers import AutoModel, AutoTokenizer
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("torch", "torch-int8", "onnx")
+
+_ONNX_INPUTS = ("input_ids", "attention_mask", "token_type_ids")
+_ONNX_OPSET = 14
+
+
+def resolve_model_source(model_name: str, bundle_dir: str, offline: bool) -> str:
+    """Return the local bundle directory if materialized, else the hub model name."""
+    if os.path.isfile(os.path.join(bundle_dir, "config.json")):
+        return bundle_dir
+    if offline:
+        raise FileNotFoundError(
+            f"SciBERT bundle not found at {bundle_dir}. Run "
+            "`python materialize_scibert.py` on a connected machine and copy the "
+            "bundle here, or set SCIBERT_OFFLINE=0 to allow a hub download."
+        )
+    logger.warning("No local SciBERT bundle at %s; using the hub", bundle_dir)
+    return model_name
+
+
+def load_encoder(backend: str, source: str, onnx_path: str):
+    """Load the SciBERT tokenizer and an encoder for the requested backend.
+
+    ``source`` is a hub model name or a local bundle directory; a local
+    directory is loaded without any network access. The ``onnx`` backend needs
+    a graph exported ahead of time by ``materialize_scibert.py --onnx``.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown SciBERT backend '{backend}'. Options: {BACKENDS}")
+
+    local_only = os.path.isdir(source)
+    tokenizer = AutoTokenizer.from_pretrained(source, local_files_only=local_only)
+    if backend == "onnx":
+        if not os.path.exists(onnx_path):
+            raise FileNotFoundError(
+                f"SciBERT ONNX graph not found at {onnx_path}. "
+                "Run `python materialize_scibert.py --onnx` to export it."
+            )
+        return tokenizer, OnnxEncoder(onnx_path)
+
+    model = AutoModel.from_pretrained(source, local_files_only=local_only)
+    model.eval()  # Set to evaluation mode — disables dropout
+    if backend == "torch-int8":
+        model = torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    return tokenizer, model
+
+
+def export_onnx(source: str, onnx_path: str) -> None:
+    """Export the fp32 SciBERT encoder to an ONNX graph with dynamic batch/sequence."""
+    logger.info("Exporting SciBERT to ONNX: %s", onnx_path)
+    local_only = os.path.isdir(source)
+    tokenizer = AutoTokenizer.from_pretrained(source, local_files_only=local_only)
+    model = AutoModel.from_pretrained(source, local_files_only=local_only)
+    model.eval()
+
+    sample = tokenizer(["corrosion sample"], return_tensors="pt")
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in _ONNX_INPUTS}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    os.makedirs(os.path.dirname(onnx_path), exist_ok=True)
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in _ONNX_INPUTS),
+            onnx_path,
+            input_names=list(_ONNX_INPUTS),
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=_ONNX_OPSET,
+        )
+    logger.info("SciBERT ONNX export complete.")
+
+
+class OnnxEncoder:
+    """Callable wrapper exposing an ONNX Runtime session like a HF encoder."""
+
+    def __init__(self, onnx_path: str):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            onnx_path, options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {node.name for node in self.session.get_inputs()}
+
+    def __call__(self, **inputs) -> SimpleNamespace:
+        feeds = {
+            name: tensor.numpy()
+            for name, tensor in inputs.items()
+            if name in self._input_names
+        }
+        (hidden,) = self.session.run(["last_hidden_state"], feeds)
+        return SimpleNamespace(last_hidden_state=torch.from_numpy(hidden))
@@ -0,0 +1,79 @@
+"""
+Background model warm-up.
+
+Loads every model artifact, runs a dummy SciBERT forward pass, PCA projection
+and forest evaluation in a daemon thread so the UI can render immediately while
+the first request's cold-start cost is paid in the background. The warm-up
+calls the models directly and leaves the embedding stores, stage memos and
+prediction cache (and their statistics) untouched.
+"""
+
+import logging
+import threading
+import time
+
+import numpy as np
+import streamlit as st
+
+from config.config import NOT_COMPOSE_COLUMNS
+from utils.predictor import CorrosionClassifier
+from utils.processors import get_scibert_embeddings
+
+logger = logging.getLogger(__name__)
+
+_WARMUP_TEXT = "model warm-up"
+
+
+class WarmupState:
+    """Readiness of the background warm-up: warming → ready | failed."""
+
+    def __init__(self):
+        self.status = "warming"
+        self.error: str | None = None
+        self.seconds: float | None = None
+        self._done = threading.Event()
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until warm-up finishes; return whether it finished in time."""
+        return self._done.wait(timeout)
+
+
+def _warm(state: WarmupState) -> None:
+    start = time.perf_counter()
+    try:
+        clf = CorrosionClassifier()
+        # Maps the inference bundle, or unpickles and compiles the artifacts
+        compiled = clf.load()
+        logger.info("Warm-up loaded %d compiled transforms", len(compiled))
+        # Loads the SciBERT backend (the main cold-start cost), then runs an
+        # uncached SciBERT → PCA → forest pass on a dummy row
+        pca_features = compiled["pca"](get_scibert_embeddings([_WARMUP_TEXT]))
+        row = np.hstack([np.zeros((1, len(NOT_COMPOSE_COLUMNS))), pca_features])
+        clf.predict_features(row)
+        state.status = "ready"
+    except Exception as e:
+        logger.exception("Model warm-up failed")
+        state.error = str(e)
+        state.status = "failed"
+    finally:
+        state.seconds = time.perf_counter() - start
+        logger.info("Model warm-up %s in %.1fs", state.status, state.seconds)
+        state._done.set()
+
+
+@st.cache_resource
+def start_warmup() -> WarmupState:
+    """Start the warm-up thread once per process and return its shared state."""
+    state = WarmupState()
+    threading.Thread(
+        target=_warm, args=(state,), name="model-warmup", daemon=True
+    ).start()
+    return state
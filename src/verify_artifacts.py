@@ -0,0 +1,92 @@
+"""
+verify-artifacts: check model artifacts against models/manifest.json.
+
+By default only size, SHA-256 and the pickled top-level type are checked; no
+pickle is unpickled and the app is not imported.
+
+Usage:
+    python verify_artifacts.py            # verify against the manifest
+    python verify_artifacts.py --load     # also load in parallel, report time/memory
+    python verify_artifacts.py --imports  # list every class each pickle references
+    python verify_artifacts.py --write    # regenerate the manifest from disk
+"""
+
+import argparse
+import os
+import sys
+
+# Add src to python path to mimic app behavior
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+from config.config import ARTIFACT_MANIFEST_PATH, BASE_PATH, MODEL_PATHS
+from utils.artifacts import (
+    build_manifest,
+    load_artifacts,
+    pickle_globals,
+    read_manifest,
+    verify_artifact,
+    write_manifest,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--load", action="store_true")
+    group.add_argument("--imports", action="store_true")
+    group.add_argument("--write", action="store_true")
+    args = parser.parse_args()
+
+    if args.write:
+        present = {n: p for n, p in MODEL_PATHS.items() if os.path.exists(p)}
+        absent = sorted(set(MODEL_PATHS) - set(present))
+        for name in absent:
+            print(f"⚠️  Skipping missing artifact '{name}': {MODEL_PATHS[name]}")
+        write_manifest(build_manifest(present, BASE_PATH), ARTIFACT_MANIFEST_PATH)
+        print(f"✅ Wrote manifest for {len(present)} artifacts: {ARTIFACT_MANIFEST_PATH}")
+        if absent:
+            # The app loads artifacts without an entry unverified
+            print("⚠️  Skipped artifacts load unverified; rerun --write once present")
+        return 0
+
+    if args.imports:
+        print("---- Inspecting Pickle Imports ----")
+        for name, path in MODEL_PATHS.items():
+            print(f"\nScanning: {name}")
+            if not os.path.exists(path):
+                continue
+            for imp in sorted(set(pickle_globals(path))):
+                print(f"  - {imp}")
+        return 0
+
+    manifest = read_manifest(ARTIFACT_MANIFEST_PATH)
+    if manifest is None:
+        print(f"❌ No manifest at {ARTIFACT_MANIFEST_PATH} (run with --write)")
+        return 1
+
+    print("---- Verifying Model Artifacts ----")
+    failed = False
+    for name, path in MODEL_PATHS.items():
+        entry = manifest["artifacts"].get(name)
+        if entry is None:
+            print(f"  - {name}: ⚠️  not in manifest (loaded unverified)")
+            continue
+        problems = verify_artifact(path, entry)
+        failed |= bool(problems)
+        status = "✅" if not problems else "❌ " + "; ".join(problems)
+        print(f"  - {name}: {status}")
+
+    if args.load and not failed:
+        print("\n---- Loading Artifacts ----")
+        _, reports = load_artifacts(MODEL_PATHS, manifest)
+        for report in reports:
+            print(
+                f"  - {report.name}: {report.seconds:.3f}s, "
+                f"~{report.nbytes / 1e6:.1f} MB resident"
+            )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())